@@ -3,12 +3,24 @@
 import tomllib
 from importlib.metadata import version as _distribution_version
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from refua_bench.gating import gate_suite
+if TYPE_CHECKING:
+    from refua_bench.gating import gate_suite
 
 __all__ = ["__version__", "gate_suite"]
 
 
+def __getattr__(name: str) -> Any:
+    # Loaded on first use so that importing the package (and the CLI entry point
+    # inside it) doesn't pull in the whole benchmarking stack.
+    if name == "gate_suite":
+        from refua_bench.gating import gate_suite
+
+        return gate_suite
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _read_version_from_pyproject() -> str | None:
     pyproject_path = Path(__file__).resolve().parents[2] / "pyproject.toml"
     if not pyproject_path.exists():
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+CACHE_ENV_VAR = "REFUA_BENCH_CACHE"
+
+
+def enabled() -> bool:
+    """Whether file-backed loaders may reuse results from earlier calls."""
+    return os.environ.get(CACHE_ENV_VAR) == "1"
+
+
+def file_key(path: str | Path) -> tuple[str, int, int]:
+    """Key a file by absolute path, mtime and size so rewrites invalidate it."""
+    resolved = os.path.abspath(path)
+    stat = os.stat(resolved)
+    return resolved, stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the "fast" extra is absent
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON, preferring orjson and falling back to the stdlib decoder."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let the stdlib decoder handle inputs orjson rejects (e.g. NaN literals)
+            # and produce the error message callers already expect.
+            pass
+    return json.loads(data)
+
+
+def dumps(
+    payload: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    newline: bool = False,
+) -> bytes:
+    """Encode JSON to UTF-8 bytes, preferring orjson and falling back to the stdlib."""
+    if _HAS_ORJSON:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(payload, option=option)
+        except TypeError:
+            # orjson is stricter than the stdlib (non-str keys, >64-bit ints, ...).
+            pass
+    text = json.dumps(payload, indent=2 if indent else None, sort_keys=sort_keys)
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-import importlib
-import json
 import os
-import subprocess
-from collections.abc import Callable, Mapping
+import sys
+import threading
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, BinaryIO, Protocol
 
+from refua_bench import _json
 from refua_bench.schema import BenchmarkCase, BenchmarkTask, load_data_file
 
+if TYPE_CHECKING:
+    import subprocess
+
 
-@runtime_checkable
 class ModelAdapter(Protocol):
     name: str
 
@@ -19,15 +22,83 @@ class ModelAdapter(Protocol):
         """Return a mapping that includes the task's prediction_key."""
 
 
+BatchResult = Mapping[str, Any] | Exception
+
+
+def predict_many(
+    adapter: ModelAdapter,
+    task: BenchmarkTask,
+    cases: Sequence[BenchmarkCase],
+    *,
+    stop_on_error: bool = False,
+) -> list[BatchResult]:
+    """Predict several cases at once, one output or exception per case, in order.
+
+    Adapters may implement ``predict_many(task, cases)`` to serve a whole batch in
+    one call; otherwise ``predict`` is called for each case. With ``stop_on_error``
+    the fallback loop stops at the first failure and marks the remaining cases as
+    skipped.
+    """
+    batched = getattr(adapter, "predict_many", None)
+    if callable(batched):
+        results = list(batched(task, cases))
+        if len(results) != len(cases):
+            raise RuntimeError(
+                f"Adapter '{adapter.name}' returned {len(results)} results "
+                f"for a batch of {len(cases)} cases"
+            )
+        return results
+    return _predict_each(adapter, task, cases, stop_on_error=stop_on_error)
+
+
+def _predict_each(
+    adapter: ModelAdapter,
+    task: BenchmarkTask,
+    cases: Sequence[BenchmarkCase],
+    *,
+    stop_on_error: bool,
+) -> list[BatchResult]:
+    outputs: list[BatchResult] = []
+    for index, case in enumerate(cases):
+        try:
+            outputs.append(adapter.predict(task, case))
+        except Exception as exc:  # noqa: BLE001
+            outputs.append(exc)
+            if stop_on_error:
+                outputs.extend(_skipped(cases[index + 1 :]))
+                break
+    return outputs
+
+
+def _skipped(cases: Sequence[BenchmarkCase]) -> list[BatchResult]:
+    return [
+        RuntimeError(f"Skipped case '{case.case_id}' after an earlier failure in its batch")
+        for case in cases
+    ]
+
+
 class GoldenAdapter:
     name = "golden"
+    thread_safe = True
 
     def predict(self, task: BenchmarkTask, case: BenchmarkCase) -> Mapping[str, Any]:
-        return dict(case.expected)
+        # Callers treat adapter outputs as read-only, so the case's own mapping is
+        # returned rather than a copy.
+        return case.expected
 
 
 class FileAdapter:
+    """Serve predictions from a JSON/YAML mapping file or a JSON Lines file.
+
+    ``.jsonl`` files (or any file with ``streaming: true``) hold one
+    ``{"task_id": ..., "case_id": ..., "prediction": ...}`` object per line. They
+    are scanned once to index line offsets, and each prediction is parsed only
+    when it is requested, so large dumps never have to fit in memory at once.
+    """
+
     name = "file"
+    # Streaming lookups share one file handle behind _stream_lock.
+    thread_safe = True
 
     def __init__(self, config: Mapping[str, Any]) -> None:
         predictions_path = config.get("predictions_path")
@@ -36,8 +107,27 @@ class FileAdapter:
                 "file adapter requires 'predictions_path' in adapter config"
             )
 
-        payload = load_data_file(Path(predictions_path))
-        self._predictions = self._normalize_predictions(payload)
+        path = os.fspath(predictions_path)
+        self._stream: BinaryIO | None = None
+        self._stream_lock = threading.Lock()
+        self._offsets: dict[tuple[str, str], int] = {}
+        self._task_ids: set[str] = set()
+        self._predictions: dict[str, dict[str, Any]] = {}
+
+        self._streaming = path.lower().endswith(".jsonl") or bool(
+            config.get("streaming", False)
+        )
+        if self._streaming:
+            stream = open(path, "rb")
+            try:
+                self._index_lines(stream, source=path)
+            except BaseException:
+                stream.close()
+                raise
+            self._stream = stream  # closed in close()
+        else:
+            payload = load_data_file(Path(path))
+            self._predictions = self._normalize_predictions(payload)
 
     @staticmethod
     def _normalize_predictions(payload: Mapping[str, Any]) -> dict[str, dict[str, Any]]:
@@ -47,26 +137,92 @@ class FileAdapter:
                 raise ValueError("Each task in predictions file must be a mapping")
             cases: dict[str, Any] = {}
             for case_id, case_prediction in task_payload.items():
-                cases[str(case_id)] = case_prediction
-            normalized[str(task_id)] = cases
+                if isinstance(case_prediction, Mapping):
+                    # Frozen once here so predict() can hand it out without copying.
+                    case_prediction = MappingProxyType(case_prediction)
+                cases[sys.intern(str(case_id))] = case_prediction
+            normalized[sys.intern(str(task_id))] = cases
         return normalized
 
+    def _index_lines(self, stream: BinaryIO, *, source: str) -> None:
+        offset = 0
+        for line_number, line in enumerate(stream, start=1):
+            if line.strip():
+                try:
+                    record = _json.loads(line)
+                except ValueError as exc:
+                    raise ValueError(
+                        f"Invalid JSON on line {line_number} of predictions file '{source}'"
+                    ) from exc
+                if (
+                    not isinstance(record, Mapping)
+                    or "task_id" not in record
+                    or "case_id" not in record
+                    or "prediction" not in record
+                ):
+                    raise ValueError(
+                        f"Line {line_number} of predictions file '{source}' must be an "
+                        "object with 'task_id', 'case_id' and 'prediction'"
+                    )
+                task_id = sys.intern(str(record["task_id"]))
+                self._task_ids.add(task_id)
+                self._offsets[(task_id, sys.intern(str(record["case_id"])))] = offset
+            offset += len(line)
+
+    def _read_prediction(self, task_id: str, case_id: str) -> Any:
+        if task_id not in self._task_ids:
+            raise KeyError(f"No predictions for task '{task_id}'")
+        offset = self._offsets.get((task_id, case_id))
+        if offset is None:
+            raise KeyError(f"No prediction for case '{case_id}' in task '{task_id}'")
+
+        with self._stream_lock:
+            if self._stream is None:
+                raise RuntimeError("file adapter predictions stream is closed")
+            self._stream.seek(offset)
+            line = self._stream.readline()
+        return _json.loads(line)["prediction"]
+
     def predict(self, task: BenchmarkTask, case: BenchmarkCase) -> Mapping[str, Any]:
-        task_data = self._predictions.get(task.task_id)
-        if task_data is None:
-            raise KeyError(f"No predictions for task '{task.task_id}'")
-        if case.case_id not in task_data:
-            raise KeyError(
-                f"No prediction for case '{case.case_id}' in task '{task.task_id}'"
-            )
+        if self._streaming:
+            case_prediction = self._read_prediction(task.task_id, case.case_id)
+        else:
+            task_data = self._predictions.get(task.task_id)
+            if task_data is None:
+                raise KeyError(f"No predictions for task '{task.task_id}'")
+            if case.case_id not in task_data:
+                raise KeyError(
+                    f"No prediction for case '{case.case_id}' in task '{task.task_id}'"
+                )
+            case_prediction = task_data[case.case_id]
 
-        case_prediction = task_data[case.case_id]
         if isinstance(case_prediction, Mapping):
-            return dict(case_prediction)
+            return case_prediction
         return {task.prediction_key: case_prediction}
 
+    def close(self) -> None:
+        with self._stream_lock:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+
 
 class CommandAdapter:
+    """Run an executable that reads a JSON request on stdin and writes JSON to stdout.
+
+    By default the command is spawned once per case. With ``persistent: true`` a
+    single worker process is kept alive instead: each request is written as one
+    JSON line on stdin and the worker must answer with one JSON line on stdout.
+    Unlike per-case mode, which skips log lines before the final JSON line, the
+    worker must write nothing but response lines to stdout; logs go to stderr.
+    The worker's stderr is passed through to ours. A request that exceeds
+    ``timeout_seconds`` kills the worker, which is respawned on the next call.
+
+    With ``batch: true`` :meth:`predict_many` sends ``{"batch": [request, ...]}``
+    in a single round-trip and expects ``{"results": [output, ...]}`` back in the
+    same order.
+    """
+
     name = "command"
 
     def __init__(self, config: Mapping[str, Any]) -> None:
@@ -85,6 +241,10 @@ class CommandAdapter:
         if not isinstance(env_raw, Mapping):
             raise ValueError("command adapter 'env' must be a mapping")
         self._env = {str(key): str(value) for key, value in env_raw.items()}
+        # Merge once; with no overrides the child simply inherits os.environ. Set
+        # refresh_env to re-read os.environ on every spawn instead.
+        self._refresh_env = bool(config.get("refresh_env", False))
+        self._merged_env = {**os.environ, **self._env} if self._env else None
 
         timeout_value = config.get("timeout_seconds", 60)
         self._timeout_seconds = float(timeout_value)
@@ -92,7 +252,63 @@ class CommandAdapter:
         include_expected = config.get("include_expected", False)
         self._include_expected = bool(include_expected)
 
+        self._persistent = bool(config.get("persistent", False))
+        self._batch = bool(config.get("batch", False))
+        self._batch_stop_on_error = bool(config.get("batch_stop_on_error", False))
+        self._process: subprocess.Popen[bytes] | None = None
+        self._task_prefixes: dict[tuple[str, str], bytes] = {}
+
+    @property
+    def batching(self) -> bool:
+        # Without batch: true, predict_many just loops over predict, so the runner
+        # keeps per-case calls and their real timings.
+        return self._batch
+
     def predict(self, task: BenchmarkTask, case: BenchmarkCase) -> Mapping[str, Any]:
+        parsed = self._send(self._encode_request(task, case))
+        if not isinstance(parsed, Mapping):
+            raise RuntimeError("Command adapter must return a JSON object")
+        return dict(parsed)
+
+    def predict_many(
+        self, task: BenchmarkTask, cases: Sequence[BenchmarkCase]
+    ) -> list[BatchResult]:
+        if not self._batch:
+            return _predict_each(self, task, cases, stop_on_error=self._batch_stop_on_error)
+        if not cases:
+            return []
+
+        request: dict[str, Any] = {"batch": [self._request(task, case) for case in cases]}
+        if self._batch_stop_on_error:
+            request["stop_on_error"] = True
+        parsed = self._send(_json.dumps(request, newline=self._persistent))
+        results = parsed.get("results") if isinstance(parsed, Mapping) else None
+        if not isinstance(results, list):
+            raise RuntimeError("Command adapter batch response must contain a 'results' list")
+        if len(results) > len(cases) or (
+            len(results) < len(cases) and not self._batch_stop_on_error
+        ):
+            raise RuntimeError(
+                f"Command adapter returned {len(results)} results "
+                f"for a batch of {len(cases)} cases"
+            )
+
+        outputs: list[BatchResult] = []
+        for case, result in zip(cases, results, strict=False):
+            if isinstance(result, Mapping):
+                outputs.append(dict(result))
+            elif isinstance(result, str):
+                outputs.append(RuntimeError(result))
+            else:
+                outputs.append(
+                    RuntimeError(
+                        f"Command adapter returned a non-object result for case '{case.case_id}'"
+                    )
+                )
+        outputs.extend(_skipped(cases[len(results) :]))
+        return outputs
+
+    def _request(self, task: BenchmarkTask, case: BenchmarkCase) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "task_id": task.task_id,
             "prediction_key": task.prediction_key,
@@ -101,42 +317,184 @@ class CommandAdapter:
         }
         if self._include_expected:
             payload["expected"] = case.expected
+        return payload
+
+    def _encode_request(self, task: BenchmarkTask, case: BenchmarkCase) -> bytes:
+        # Same document as _request(), but the task fields are encoded once per
+        # task and spliced in front of the per-case fields.
+        key = (task.task_id, task.prediction_key)
+        prefix = self._task_prefixes.get(key)
+        if prefix is None:
+            prefix = _json.dumps(
+                {"task_id": task.task_id, "prediction_key": task.prediction_key}
+            )[:-1]
+            self._task_prefixes[key] = prefix
+
+        fields: dict[str, Any] = {"case_id": case.case_id, "input": case.input}
+        if self._include_expected:
+            fields["expected"] = case.expected
+        return prefix + b"," + _json.dumps(fields, newline=self._persistent)[1:]
+
+    def _child_env(self) -> dict[str, str] | None:
+        if self._refresh_env and self._env:
+            return {**os.environ, **self._env}
+        return self._merged_env
+
+    def _send(self, request: bytes) -> Any:
+        if self._persistent:
+            return self._exchange(request)
+        return self._run_once(request)
+
+    def close(self) -> None:
+        import subprocess
+
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+        if process.stdin is not None:
+            process.stdin.close()
+        try:
+            process.wait(timeout=self._timeout_seconds)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if process.stdout is not None:
+            process.stdout.close()
+
+    def __enter__(self) -> CommandAdapter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        process = getattr(self, "_process", None)
+        if process is not None and process.poll() is None:
+            process.kill()
+
+    def _run_once(self, request: bytes) -> Any:
+        import subprocess
 
         completed = subprocess.run(
             self._command,
             check=False,
-            input=json.dumps(payload),
-            text=True,
+            input=request,
             capture_output=True,
-            env={**os.environ, **self._env},
+            env=self._child_env(),
             timeout=self._timeout_seconds,
         )
         if completed.returncode != 0:
-            stderr = completed.stderr.strip()
+            stderr = completed.stderr.decode("utf-8", errors="replace").strip()
             raise RuntimeError(
                 f"Command adapter failed with code {completed.returncode}: {stderr}"
             )
 
-        stdout = completed.stdout.strip()
+        stdout = completed.stdout.decode("utf-8", errors="replace").strip()
         if not stdout:
             raise RuntimeError("Command adapter returned empty stdout")
 
-        parsed = _parse_last_json_line(stdout)
-        if not isinstance(parsed, Mapping):
-            raise RuntimeError("Command adapter must return a JSON object")
-        return dict(parsed)
+        return _parse_last_json_line(stdout)
+
+    def _exchange(self, request: bytes) -> Any:
+        import subprocess
+
+        process = self._worker()
+        assert process.stdin is not None and process.stdout is not None
+
+        expired = threading.Event()
+
+        def _expire() -> None:
+            expired.set()
+            process.kill()
+
+        watchdog = threading.Timer(self._timeout_seconds, _expire)
+        watchdog.start()
+        try:
+            process.stdin.write(request)
+            process.stdin.flush()
+            line = process.stdout.readline()
+        except OSError:
+            line = b""
+        finally:
+            watchdog.cancel()
+
+        # The watchdog can fire between readline() returning and cancel(), so a
+        # complete response is kept even when it did; only a missing or cut-off
+        # line counts as a timeout.
+        parse_error: ValueError | None = None
+        if line.strip():
+            try:
+                response = _json.loads(line)
+            except ValueError as exc:
+                parse_error = exc
+            else:
+                if expired.is_set():
+                    self._discard_worker()
+                return response
+
+        if expired.is_set():
+            self._discard_worker()
+            raise subprocess.TimeoutExpired(self._command, self._timeout_seconds)
+        if parse_error is None:
+            returncode = self._discard_worker()
+            raise RuntimeError(
+                f"Command adapter worker exited with code {returncode} before responding"
+            )
+        raise RuntimeError(
+            "Unable to parse JSON output from command adapter worker"
+        ) from parse_error
+
+    def _worker(self) -> subprocess.Popen[bytes]:
+        import subprocess
+
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                env=self._child_env(),
+            )
+        return self._process
+
+    def _discard_worker(self) -> int | None:
+        process = self._process
+        self._process = None
+        if process is None:
+            return None
+        if process.poll() is None:
+            process.kill()
+        returncode = process.wait()
+        for stream in (process.stdin, process.stdout):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+        return returncode
 
 
 def _parse_last_json_line(stdout: str) -> Any:
-    lines = [line for line in stdout.splitlines() if line.strip()]
-    for line in reversed(lines):
+    for line in reversed(stdout.splitlines()):
+        candidate = line.strip()
+        # Log lines and tracebacks never start a JSON object or array; skip them
+        # without paying for a failed decode.
+        if not candidate or candidate[0] not in "{[":
+            continue
         try:
-            return json.loads(line)
-        except json.JSONDecodeError:
+            return _json.loads(candidate)
+        except ValueError:
             continue
     raise RuntimeError("Unable to parse JSON output from command adapter")
 
 
+def close_adapter(adapter: ModelAdapter) -> None:
+    """Release resources held by adapters that expose a ``close()`` method."""
+    close = getattr(adapter, "close", None)
+    if callable(close):
+        close()
+
+
 def load_adapter(spec: str, config: Mapping[str, Any] | None = None) -> ModelAdapter:
     adapter_config: Mapping[str, Any] = {} if config is None else config
 
@@ -152,6 +510,8 @@ def load_adapter(spec: str, config: Mapping[str, Any] | None = None) -> ModelAda
     if not sep:
         raise ValueError("Custom adapter must use format 'module.path:AdapterClass'")
 
+    import importlib
+
     module = importlib.import_module(module_name)
     target = getattr(module, attr_name)
 
@@ -166,7 +526,7 @@ def load_adapter(spec: str, config: Mapping[str, Any] | None = None) -> ModelAda
         except TypeError:
             instance = target()
 
-    if not isinstance(instance, ModelAdapter):
+    if not hasattr(instance, "name") or not callable(getattr(instance, "predict", None)):
         raise TypeError(f"Loaded adapter from '{spec}' does not implement ModelAdapter")
 
     return instance
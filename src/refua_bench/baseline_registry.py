@@ -1,44 +1,82 @@
 from __future__ import annotations
 
-import json
-import shutil
+import os
+import re
 from collections.abc import Mapping
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from refua_bench import _cache, _json
+
 REGISTRY_VERSION = 1
 
+# Runs of anything str.isalnum() rejects; \W already excludes letters and digits
+# in every script, so slugs stay identical to the old per-character rewrite.
+_SLUG_SEPARATORS = re.compile(r"[\W_]+")
+
 
 def load_registry(path: str | Path) -> dict[str, Any]:
-    registry_path = Path(path)
-    if not registry_path.exists():
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+    except FileNotFoundError:
         return {
             "version": REGISTRY_VERSION,
             "baselines": {},
         }
 
-    payload = json.loads(registry_path.read_text(encoding="utf-8"))
+    payload = _json.loads(data)
+    # One structural match covers the well-formed case; the individual checks
+    # below only run to pick the error message.
+    match payload:
+        case {"version": int(), "baselines": dict()}:
+            return payload
+
     if not isinstance(payload, dict):
         raise ValueError("Registry JSON must be an object")
-
-    version = payload.get("version")
-    baselines = payload.get("baselines")
-    if not isinstance(version, int):
+    if not isinstance(payload.get("version"), int):
         raise ValueError("Registry must include integer 'version'")
-    if not isinstance(baselines, dict):
-        raise ValueError("Registry must include object 'baselines'")
-
-    return payload
+    raise ValueError("Registry must include object 'baselines'")
 
 
 def save_registry(path: str | Path, registry: Mapping[str, Any]) -> None:
-    out_path = Path(path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(dict(registry), indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    # Encoded before the open, so a registry that fails to encode leaves the saved
+    # one untouched. As in promote_baseline, the directory is only created when it
+    # is missing.
+    data = _json.dumps(dict(registry), indent=True, sort_keys=True, newline=True)
+    try:
+        handle = open(path, "wb")
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path, "wb")
+    with handle:
+        handle.write(data)
+    _load_registry_cached.cache_clear()
+
+
+def load_registry_cached(path: str | Path) -> dict[str, Any]:
+    """Like ``load_registry`` for read-only callers, reusing decodes when enabled.
+
+    With ``REFUA_BENCH_CACHE=1`` the decoded registry is cached by path, mtime and
+    size and shared between callers, so it must not be mutated.
+    """
+    if not _cache.enabled():
+        return load_registry(path)
+    try:
+        key = _cache.file_key(path)
+    except FileNotFoundError:
+        return load_registry(path)
+    return _load_registry_cached(*key)
+
+
+@lru_cache(maxsize=32)
+def _load_registry_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # The stat fields are only part of the cache key: rewriting the file changes
+    # them, so stale entries are never served. Results are shared and must not be
+    # mutated; callers that edit the registry use load_registry() instead.
+    return load_registry(path)
 
 
 def list_baselines(
@@ -50,22 +88,21 @@ def list_baselines(
     if not isinstance(baselines_root, Mapping):
         return []
 
+    # Well-formed registries are the norm, so entries are read assuming the
+    # expected shape and malformed ones are skipped when a lookup fails.
     rows: list[dict[str, Any]] = []
     for current_suite_name, suite_entries in baselines_root.items():
         if suite_name is not None and current_suite_name != suite_name:
             continue
-        if not isinstance(suite_entries, Mapping):
+        try:
+            suite_items = suite_entries.items()
+        except AttributeError:
             continue
 
-        for baseline_name, baseline_payload in suite_entries.items():
-            if not isinstance(baseline_payload, Mapping):
-                continue
-            current = baseline_payload.get("current")
-            if not isinstance(current, Mapping):
-                continue
-
-            rows.append(
-                {
+        for baseline_name, baseline_payload in suite_items:
+            try:
+                current = baseline_payload["current"]
+                row = {
                     "suite_name": str(current_suite_name),
                     "baseline_name": str(baseline_name),
                     "run_path": str(current.get("run_path", "")),
@@ -73,21 +110,28 @@ def list_baselines(
                     "updated_at": current.get("updated_at"),
                     "run_id": current.get("run_id"),
                 }
-            )
+            except (AttributeError, KeyError, TypeError):
+                continue
+            rows.append(row)
 
     rows.sort(key=lambda item: (item["suite_name"], item["baseline_name"]))
     return rows
 
 
 def resolve_baseline_path(
-    registry: Mapping[str, Any],
+    registry: Mapping[str, Any] | str | Path,
     *,
     suite_name: str,
     baseline_name: str,
 ) -> Path:
-    entry = get_baseline_entry(
-        registry, suite_name=suite_name, baseline_name=baseline_name
-    )
+    if isinstance(registry, Mapping):
+        entry = get_baseline_entry(
+            registry, suite_name=suite_name, baseline_name=baseline_name
+        )
+    else:
+        entry = load_baseline_entry(
+            registry, suite_name=suite_name, baseline_name=baseline_name
+        )
     if entry is None:
         raise KeyError(f"No baseline named '{baseline_name}' for suite '{suite_name}'")
 
@@ -106,25 +150,37 @@ def get_baseline_entry(
     suite_name: str,
     baseline_name: str,
 ) -> dict[str, Any] | None:
-    baselines_root = registry.get("baselines")
-    if not isinstance(baselines_root, Mapping):
-        return None
-
-    suite_entries = baselines_root.get(suite_name)
-    if not isinstance(suite_entries, Mapping):
-        return None
-
-    baseline_payload = suite_entries.get(baseline_name)
-    if not isinstance(baseline_payload, Mapping):
+    try:
+        current = registry["baselines"][suite_name][baseline_name]["current"]
+    except (KeyError, TypeError):
         return None
-
-    current = baseline_payload.get("current")
     if not isinstance(current, Mapping):
         return None
 
+    # A copy, so callers can edit the entry without touching the registry (or a
+    # cached registry shared by load_baseline_entry).
     return dict(current)
 
 
+def load_baseline_entry(
+    path: str | Path,
+    *,
+    suite_name: str,
+    baseline_name: str,
+) -> dict[str, Any] | None:
+    """Read one baseline's current entry from a registry file.
+
+    Read-only callers use this instead of ``load_registry``: only a copy of the
+    requested entry is handed out, so the rest of the registry can be freed. With
+    ``REFUA_BENCH_CACHE=1`` decoded registries are also cached by path, mtime and
+    size, so repeated lookups skip the disk read and JSON decode.
+    """
+    registry = load_registry_cached(path)
+    return get_baseline_entry(
+        registry, suite_name=suite_name, baseline_name=baseline_name
+    )
+
+
 def promote_baseline(
     *,
     registry: dict[str, Any],
@@ -137,10 +193,19 @@ def promote_baseline(
     provenance: Mapping[str, Any] | None,
     compare_summary: Mapping[str, Any] | None,
     store_dir: str | Path | None = None,
+    run_payload: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
+    """Copy a candidate run into the registry store and make it the current baseline.
+
+    Pass ``run_payload`` when the candidate artifact has already been decoded to
+    avoid parsing it a second time. Plain-dict ``provenance`` and
+    ``compare_summary`` values are stored without copying.
+    """
     candidate_file = Path(candidate_path)
-    if not candidate_file.exists():
-        raise FileNotFoundError(f"Candidate run not found: {candidate_file}")
+    try:
+        raw = candidate_file.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Candidate run not found: {candidate_file}") from None
 
     promoted_at = datetime.now(UTC).isoformat()
     registry_file = Path(registry_path)
@@ -155,10 +220,9 @@ def promote_baseline(
     else:
         target_dir = Path(store_dir) / _slug(suite_name) / _slug(baseline_name)
 
-    target_dir.mkdir(parents=True, exist_ok=True)
-
-    run_payload = json.loads(candidate_file.read_text(encoding="utf-8"))
-    if not isinstance(run_payload, dict):
+    if run_payload is None:
+        run_payload = _json.loads(raw)
+    if not isinstance(run_payload, Mapping):
         raise ValueError("Candidate run artifact must be a JSON object")
     run_id = str(run_payload.get("run_id", "unknown-run"))
 
@@ -166,7 +230,18 @@ def promote_baseline(
     target_name = f"{timestamp}__{_slug(run_id)}.json"
     target_path = target_dir / target_name
 
-    shutil.copy2(candidate_file, target_path)
+    # Write the bytes already in memory rather than re-reading the candidate;
+    # copystat keeps the timestamps and mode copy2 used to preserve. The store
+    # directory usually exists already, so it is only created on demand.
+    try:
+        target_path.write_bytes(raw)
+    except FileNotFoundError:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target_path.write_bytes(raw)
+
+    import shutil
+
+    shutil.copystat(candidate_file, target_path)
 
     baselines_root = registry.setdefault("baselines", {})
     if not isinstance(baselines_root, dict):
@@ -192,13 +267,13 @@ def promote_baseline(
         "suite_name": suite_name,
         "suite_version": suite_version,
         "baseline_name": baseline_name,
-        "run_path": str(target_path.resolve()),
+        "run_path": os.path.abspath(target_path),
         "run_id": run_payload.get("run_id"),
         "updated_at": promoted_at,
         "notes": notes,
         "summary": run_payload.get("summary"),
-        "provenance": {} if provenance is None else dict(provenance),
-        "compare_summary": None if compare_summary is None else dict(compare_summary),
+        "provenance": _as_dict(provenance, default={}),
+        "compare_summary": _as_dict(compare_summary, default=None),
     }
 
     history.append(current)
@@ -207,14 +282,18 @@ def promote_baseline(
     return current
 
 
+def _as_dict(
+    value: Mapping[str, Any] | None, *, default: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    # Plain dicts are stored as-is; the registry takes ownership of what it is given.
+    if value is None:
+        return default
+    if type(value) is dict:
+        return value
+    return dict(value)
+
+
+@lru_cache(maxsize=256)
 def _slug(value: str) -> str:
-    result = []
-    for char in value.lower().strip():
-        if char.isalnum():
-            result.append(char)
-        else:
-            result.append("-")
-    slug = "".join(result).strip("-")
-    while "--" in slug:
-        slug = slug.replace("--", "-")
+    slug = _SLUG_SEPARATORS.sub("-", value.lower()).strip("-")
     return slug or "default"
@@ -1,40 +1,23 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-import yaml
-
-from refua_bench.adapters import GoldenAdapter, load_adapter
-from refua_bench.baseline_registry import (
-    get_baseline_entry,
-    list_baselines,
-    load_registry,
-    promote_baseline,
-    resolve_baseline_path,
-    save_registry,
-)
-from refua_bench.compare import StatisticalPolicy, compare_runs
-from refua_bench.provenance import collect_provenance
-from refua_bench.reporting import (
-    read_json,
-    render_compare_markdown,
-    render_run_markdown,
-    write_json,
-    write_markdown,
-)
-from refua_bench.run_artifact import validate_run_artifact
-from refua_bench.runner import run_benchmark
-from refua_bench.schema import (
-    BenchmarkSuite,
-    load_data_file,
-    load_suite,
-    suite_from_mapping,
-)
+from typing import IO, TYPE_CHECKING, Any
+
+from refua_bench import _json
+
+if TYPE_CHECKING:
+    from refua_bench.compare import ComparisonReport, StatisticalPolicy
+    from refua_bench.schema import BenchmarkSuite
+
+# Submodules are imported inside the handlers that use them, so `--help` and
+# light commands such as `baseline list` don't pay for loading the statistics,
+# runner and YAML stacks.
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -60,7 +43,6 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Exit non-zero if any case fails",
     )
-    run_parser.set_defaults(handler=_cmd_run)
 
     compare_parser = subparsers.add_parser(
         "compare",
@@ -106,7 +88,6 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Fail when bootstrap result is inconclusive",
     )
-    compare_parser.set_defaults(handler=_cmd_compare)
 
     gate_parser = subparsers.add_parser(
         "gate",
@@ -151,7 +132,6 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Fail when bootstrap result is inconclusive",
     )
-    gate_parser.set_defaults(handler=_cmd_gate)
 
     init_parser = subparsers.add_parser(
         "init",
@@ -166,7 +146,6 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Overwrite existing files in the target directory",
     )
-    init_parser.set_defaults(handler=_cmd_init)
 
     baseline_parser = subparsers.add_parser(
         "baseline",
@@ -188,7 +167,6 @@ def build_parser() -> argparse.ArgumentParser:
     baseline_list_parser.add_argument(
         "--output", type=Path, help="Optional JSON output path"
     )
-    baseline_list_parser.set_defaults(handler=_cmd_baseline_list)
 
     baseline_resolve_parser = baseline_subparsers.add_parser(
         "resolve",
@@ -211,7 +189,6 @@ def build_parser() -> argparse.ArgumentParser:
         required=True,
         help="Named baseline to resolve",
     )
-    baseline_resolve_parser.set_defaults(handler=_cmd_baseline_resolve)
 
     baseline_promote_parser = baseline_subparsers.add_parser(
         "promote",
@@ -262,22 +239,57 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Optional JSON output with promotion details",
     )
-    baseline_promote_parser.set_defaults(handler=_cmd_baseline_promote)
 
     return parser
 
 
+@lru_cache(maxsize=1)
+def get_parser() -> argparse.ArgumentParser:
+    """Return a shared parser, built on first use.
+
+    parse_args() does not mutate the parser, so one instance can serve repeated
+    (and concurrent) main() calls from embedding scripts and tests.
+    """
+    return build_parser()
+
+
 def main(argv: Sequence[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    # Usage errors exit from parse_args(); only handler failures become exit code 2.
+    # Handlers are typed to return int, and KeyboardInterrupt is not an Exception,
+    # so it still propagates.
+    args = get_parser().parse_args(argv)
 
     try:
-        return int(args.handler(args))
+        return _dispatch(args)
     except Exception as exc:  # noqa: BLE001
         print(f"error: {exc}", file=sys.stderr)
         return 2
 
 
+def _dispatch(args: argparse.Namespace) -> int:
+    # Dispatching on the parsed command names keeps handlers out of the parser's
+    # defaults, so the shared parser carries no per-command state.
+    match args.command:
+        case "run":
+            return _cmd_run(args)
+        case "compare":
+            return _cmd_compare(args)
+        case "gate":
+            return _cmd_gate(args)
+        case "init":
+            return _cmd_init(args)
+        case "baseline":
+            match args.baseline_command:
+                case "list":
+                    return _cmd_baseline_list(args)
+                case "resolve":
+                    return _cmd_baseline_resolve(args)
+                case "promote":
+                    return _cmd_baseline_promote(args)
+            raise ValueError(f"Unknown baseline command: {args.baseline_command}")
+    raise ValueError(f"Unknown command: {args.command}")
+
+
 def _add_common_run_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--suite", type=Path, required=True, help="Benchmark suite config"
@@ -289,7 +301,13 @@ def _add_common_run_arguments(parser: argparse.ArgumentParser) -> None:
     )
     parser.add_argument(
         "--adapter-config",
-        help="Adapter config JSON string or path to YAML/JSON file",
+        help="Adapter config JSON string or @path to YAML/JSON file",
+    )
+    parser.add_argument(
+        "--task-workers",
+        type=int,
+        default=1,
+        help="Run tasks on this many threads when the adapter is thread-safe",
     )
 
 
@@ -298,17 +316,22 @@ def _add_provenance_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--model-version", help="Model version for provenance")
     parser.add_argument(
         "--model-params",
-        help="Model parameter mapping as JSON string or path to YAML/JSON file",
+        help="Model parameter mapping as JSON string or @path to YAML/JSON file",
     )
     parser.add_argument(
         "--provenance-extra",
-        help="Extra provenance mapping as JSON string or path to YAML/JSON file",
+        help="Extra provenance mapping as JSON string or @path to YAML/JSON file",
     )
     parser.add_argument(
         "--no-provenance",
         action="store_true",
         help="Disable automatic provenance capture",
     )
+    parser.add_argument(
+        "--full-provenance",
+        action="store_true",
+        help="Re-query runtime, dependency and git details instead of reusing cached values",
+    )
 
 
 def _add_statistical_arguments(parser: argparse.ArgumentParser) -> None:
@@ -335,15 +358,52 @@ def _add_statistical_arguments(parser: argparse.ArgumentParser) -> None:
         type=int,
         help="Optional random seed for bootstrap",
     )
+    parser.add_argument(
+        "--no-fast-path",
+        action="store_true",
+        help="Always run the bootstrap, even for tasks with identical paired cases",
+    )
+    parser.add_argument(
+        "--sequential-stopping",
+        action="store_true",
+        help="Stop bootstrap resampling early once the CI verdict is settled",
+    )
+    parser.add_argument(
+        "--screen-sigmas",
+        type=float,
+        default=0.0,
+        help="Skip the bootstrap for tasks this many standard errors from the threshold",
+    )
+    parser.add_argument(
+        "--share-resamples",
+        action="store_true",
+        help="Reuse bootstrap index draws across tasks with the same number of cases",
+    )
+    parser.add_argument(
+        "--bootstrap-workers",
+        type=int,
+        default=1,
+        help="Run per-task bootstraps in this many processes",
+    )
 
 
 def _cmd_run(args: argparse.Namespace) -> int:
+    from refua_bench.adapters import close_adapter, load_adapter
+    from refua_bench.reporting import render_run_markdown, write_json, write_markdown
+    from refua_bench.runner import run_benchmark
+    from refua_bench.schema import load_suite
+
     suite = load_suite(args.suite)
     adapter_config = _load_optional_mapping(args.adapter_config)
     adapter = load_adapter(args.adapter, adapter_config)
 
     provenance = _build_provenance(args, adapter.name, adapter_config)
-    run_payload = run_benchmark(suite, adapter, provenance=provenance).to_dict()
+    try:
+        run_payload = run_benchmark(
+            suite, adapter, provenance=provenance, parallelism=args.task_workers
+        ).to_dict()
+    finally:
+        close_adapter(adapter)
     write_json(args.output, run_payload)
 
     if args.markdown is not None:
@@ -355,70 +415,120 @@ def _cmd_run(args: argparse.Namespace) -> int:
 
 
 def _cmd_compare(args: argparse.Namespace) -> int:
+    from refua_bench.compare import compare_runs
+    from refua_bench.run_artifact import load_and_validate_run_artifact
+    from refua_bench.schema import load_suite
+
     suite = load_suite(args.suite)
     baseline_path = _resolve_baseline_arg(args, suite)
 
-    baseline = validate_run_artifact(
-        read_json(baseline_path),
+    baseline = load_and_validate_run_artifact(
+        baseline_path,
         source=f"baseline run artifact '{baseline_path}'",
         suite=suite,
     )
-    candidate = validate_run_artifact(
-        read_json(args.candidate),
+    candidate = load_and_validate_run_artifact(
+        args.candidate,
         source=f"candidate run artifact '{args.candidate}'",
         suite=suite,
     )
 
     policy = _policy_from_args(args)
-    comparison = compare_runs(suite, baseline, candidate, policy=policy).to_dict()
-    write_json(args.output, comparison)
-
-    if args.markdown is not None:
-        write_markdown(args.markdown, render_compare_markdown(comparison))
+    report = compare_runs(
+        suite,
+        baseline,
+        candidate,
+        policy=policy,
+        fast_path=not args.no_fast_path,
+        workers=args.bootstrap_workers,
+    )
+    _write_comparison(args.output, args.markdown, report.to_dict())
 
     fail_on_regression = not bool(args.no_fail_on_regression)
-    if fail_on_regression and _comparison_failed(comparison, args.fail_on_uncertain):
+    if fail_on_regression and report.failed(args.fail_on_uncertain):
         return 1
     return 0
 
 
 def _cmd_gate(args: argparse.Namespace) -> int:
+    from refua_bench.adapters import close_adapter, load_adapter
+    from refua_bench.compare import compare_runs
+    from refua_bench.reporting import write_json
+    from refua_bench.run_artifact import (
+        load_and_validate_run_artifact,
+        validate_run_artifact,
+    )
+    from refua_bench.runner import run_benchmark
+    from refua_bench.schema import load_suite
+
     suite = load_suite(args.suite)
     adapter_config = _load_optional_mapping(args.adapter_config)
     adapter = load_adapter(args.adapter, adapter_config)
 
     provenance = _build_provenance(args, adapter.name, adapter_config)
-    candidate_run = run_benchmark(suite, adapter, provenance=provenance).to_dict()
-    write_json(args.candidate_output, candidate_run)
+    try:
+        candidate_run = run_benchmark(
+            suite, adapter, provenance=provenance, parallelism=args.task_workers
+        ).to_dict()
+    finally:
+        close_adapter(adapter)
+    # Validate the in-memory run once and reuse it for both the artifact on disk
+    # and the comparison, rather than treating the written file as a new input.
     validated_candidate = validate_run_artifact(
         candidate_run,
         source="candidate run artifact (current gate run)",
         suite=suite,
     )
+    write_json(args.candidate_output, validated_candidate)
 
     baseline_path = _resolve_baseline_arg(args, suite)
-    baseline = validate_run_artifact(
-        read_json(baseline_path),
+    baseline = load_and_validate_run_artifact(
+        baseline_path,
         source=f"baseline run artifact '{baseline_path}'",
         suite=suite,
     )
 
     policy = _policy_from_args(args)
-    comparison = compare_runs(
-        suite, baseline, validated_candidate, policy=policy
-    ).to_dict()
-    write_json(args.output, comparison)
-
-    if args.markdown is not None:
-        write_markdown(args.markdown, render_compare_markdown(comparison))
+    report = compare_runs(
+        suite,
+        baseline,
+        validated_candidate,
+        policy=policy,
+        fast_path=not args.no_fast_path,
+        workers=args.bootstrap_workers,
+    )
+    _write_comparison(args.output, args.markdown, report.to_dict())
 
     fail_on_regression = not bool(args.no_fail_on_regression)
-    if fail_on_regression and _comparison_failed(comparison, args.fail_on_uncertain):
+    if fail_on_regression and report.failed(args.fail_on_uncertain):
         return 1
     return 0
 
 
+def _write_comparison(
+    output: Path, markdown: Path | None, comparison: dict[str, Any]
+) -> None:
+    from refua_bench.reporting import render_compare_markdown, write_json, write_markdown
+
+    if markdown is None:
+        write_json(output, comparison)
+        return
+
+    # Encoding and writing the JSON report overlaps with rendering the markdown;
+    # neither mutates the comparison.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        json_written = executor.submit(write_json, output, comparison)
+        rendered = render_compare_markdown(comparison)
+        markdown_written = executor.submit(write_markdown, markdown, rendered)
+        json_written.result()
+        markdown_written.result()
+
+
 def _cmd_init(args: argparse.Namespace) -> int:
+    from refua_bench.reporting import encode_json
+    from refua_bench.runner import synthesize_golden_artifact
+    from refua_bench.schema import dump_yaml, suite_from_mapping
+
     directory = args.directory
     directory.mkdir(parents=True, exist_ok=True)
 
@@ -428,49 +538,73 @@ def _cmd_init(args: argparse.Namespace) -> int:
     command_config_path = directory / "command_adapter_config.yaml"
     command_script_path = directory / "adapter_command.py"
 
-    file_paths = [
-        suite_path,
-        baseline_path,
-        file_predictions_path,
-        command_config_path,
-        command_script_path,
-    ]
-
-    if (not args.force) and any(path.exists() for path in file_paths):
-        existing = [str(path.name) for path in file_paths if path.exists()]
-        raise FileExistsError(
-            "Target directory already contains files: "
-            + ", ".join(sorted(existing))
-            + ". Use --force to overwrite."
-        )
-
     suite_payload = _starter_suite_payload(args.name)
-    suite_path.write_text(
-        yaml.safe_dump(suite_payload, sort_keys=False), encoding="utf-8"
-    )
 
-    suite = suite_from_mapping(suite_payload)
-    baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
-    write_json(baseline_path, baseline)
+    def _write_baseline(handle: IO[bytes]) -> None:
+        suite = suite_from_mapping(suite_payload)
+        handle.write(encode_json(synthesize_golden_artifact(suite)))
 
-    write_json(file_predictions_path, _starter_candidate_predictions())
-    command_config_path.write_text(
-        yaml.safe_dump(
-            {
-                "command": [sys.executable, str(command_script_path)],
-                "timeout_seconds": 30,
-            },
-            sort_keys=False,
+    command_config = {
+        "command": [sys.executable, str(command_script_path)],
+        "timeout_seconds": 30,
+    }
+    writers: dict[Path, Callable[[IO[bytes]], object]] = {
+        suite_path: lambda handle: dump_yaml(suite_payload, handle),
+        baseline_path: _write_baseline,
+        file_predictions_path: lambda handle: handle.write(
+            encode_json(_starter_candidate_predictions())
         ),
-        encoding="utf-8",
-    )
-    command_script_path.write_text(_starter_command_adapter_script(), encoding="utf-8")
+        command_config_path: lambda handle: dump_yaml(command_config, handle),
+        command_script_path: lambda handle: handle.write(
+            _starter_command_adapter_script().encode("utf-8")
+        ),
+    }
+    _write_files(writers, overwrite=bool(args.force))
 
     return 0
 
 
+def _write_files(
+    writers: Mapping[Path, Callable[[IO[bytes]], object]], *, overwrite: bool
+) -> None:
+    # Without overwrite every file is claimed with an exclusive create ("xb"), so
+    # the existence check and the write can't race. If any target already exists,
+    # the files claimed so far are removed and nothing is written. Once claimed,
+    # each writer streams its contents into its handle concurrently; the golden
+    # baseline run overlaps with the static files.
+    mode = "wb" if overwrite else "xb"
+    with ExitStack() as stack:
+        claimed: list[tuple[Path, IO[bytes], Callable[[IO[bytes]], object]]] = []
+        existing: list[str] = []
+        for path, write in writers.items():
+            try:
+                handle = stack.enter_context(path.open(mode))
+            except FileExistsError:
+                existing.append(path.name)
+                continue
+            claimed.append((path, handle, write))
+
+        if existing:
+            stack.close()
+            for path, _, _ in claimed:
+                path.unlink(missing_ok=True)
+            raise FileExistsError(
+                "Target directory already contains files: "
+                + ", ".join(sorted(existing))
+                + ". Use --force to overwrite."
+            )
+
+        with ThreadPoolExecutor(max_workers=len(claimed) or 1) as executor:
+            futures = [executor.submit(write, handle) for _, handle, write in claimed]
+            for future in futures:
+                future.result()
+
+
 def _cmd_baseline_list(args: argparse.Namespace) -> int:
-    registry = load_registry(args.registry)
+    from refua_bench.baseline_registry import list_baselines, load_registry_cached
+    from refua_bench.reporting import write_json
+
+    registry = load_registry_cached(args.registry)
     rows = list_baselines(registry, suite_name=args.suite_name)
 
     if args.output is not None:
@@ -491,10 +625,12 @@ def _cmd_baseline_list(args: argparse.Namespace) -> int:
 
 
 def _cmd_baseline_resolve(args: argparse.Namespace) -> int:
+    from refua_bench.baseline_registry import resolve_baseline_path
+    from refua_bench.schema import load_suite
+
     suite = load_suite(args.suite)
-    registry = load_registry(args.registry)
     resolved = resolve_baseline_path(
-        registry,
+        args.registry,
         suite_name=suite.name,
         baseline_name=args.baseline_name,
     )
@@ -503,11 +639,23 @@ def _cmd_baseline_resolve(args: argparse.Namespace) -> int:
 
 
 def _cmd_baseline_promote(args: argparse.Namespace) -> int:
+    from refua_bench.baseline_registry import (
+        get_baseline_entry,
+        load_registry,
+        promote_baseline,
+        resolve_baseline_path,
+        save_registry,
+    )
+    from refua_bench.compare import compare_runs
+    from refua_bench.reporting import write_json
+    from refua_bench.run_artifact import load_and_validate_run_artifact
+    from refua_bench.schema import load_suite
+
     suite = load_suite(args.suite)
     registry = load_registry(args.registry)
 
-    candidate_run = validate_run_artifact(
-        read_json(args.candidate),
+    candidate_run = load_and_validate_run_artifact(
+        args.candidate,
         source=f"candidate run artifact '{args.candidate}'",
         suite=suite,
     )
@@ -517,29 +665,30 @@ def _cmd_baseline_promote(args: argparse.Namespace) -> int:
         baseline_name=args.baseline_name,
     )
 
-    compare_payload: dict[str, Any] | None = None
+    report: ComparisonReport | None = None
     if existing_entry is not None:
         current_baseline_path = resolve_baseline_path(
             registry,
             suite_name=suite.name,
             baseline_name=args.baseline_name,
         )
-        baseline_run = validate_run_artifact(
-            read_json(current_baseline_path),
+        baseline_run = load_and_validate_run_artifact(
+            current_baseline_path,
             source=f"baseline run artifact '{current_baseline_path}'",
             suite=suite,
         )
 
         policy = _policy_from_args(args)
-        compare_payload = compare_runs(
+        report = compare_runs(
             suite,
             baseline_run,
             candidate_run,
             policy=policy,
-        ).to_dict()
+            fast_path=not args.no_fast_path,
+            workers=args.bootstrap_workers,
+        )
 
-        failed = _comparison_failed(compare_payload, args.fail_on_uncertain)
-        if failed and (not args.allow_regression):
+        if report.failed(args.fail_on_uncertain) and (not args.allow_regression):
             raise RuntimeError(
                 "Candidate did not pass safety checks against current baseline. "
                 "Use --allow-regression to override."
@@ -554,10 +703,9 @@ def _cmd_baseline_promote(args: argparse.Namespace) -> int:
         candidate_path=args.candidate,
         notes=args.notes,
         provenance=_mapping_or_none(candidate_run.get("provenance")),
-        compare_summary=(
-            None if compare_payload is None else compare_payload.get("summary")
-        ),
+        compare_summary=None if report is None else report.summary,
         store_dir=args.store_dir,
+        run_payload=candidate_run,
     )
     save_registry(args.registry, registry)
 
@@ -566,7 +714,8 @@ def _cmd_baseline_promote(args: argparse.Namespace) -> int:
             args.output,
             {
                 "promoted": promoted,
-                "compare": compare_payload,
+                # The full comparison is only materialized when it is written out.
+                "compare": None if report is None else report.to_dict(),
             },
         )
 
@@ -574,28 +723,15 @@ def _cmd_baseline_promote(args: argparse.Namespace) -> int:
     return 0
 
 
-def _comparison_failed(
-    compare_payload: dict[str, Any], fail_on_uncertain: bool
-) -> bool:
-    summary = compare_payload.get("summary", {})
-    regressions = int(summary.get("regressions", 0)) if isinstance(summary, dict) else 0
-    uncertain = int(summary.get("uncertain", 0)) if isinstance(summary, dict) else 0
-
-    if regressions > 0:
-        return True
-    if fail_on_uncertain and uncertain > 0:
-        return True
-    return False
-
-
 def _resolve_baseline_arg(args: argparse.Namespace, suite: BenchmarkSuite) -> Path:
+    from refua_bench.baseline_registry import resolve_baseline_path
+
     if args.baseline is not None:
         return args.baseline
 
     if args.registry is not None and args.baseline_name:
-        registry = load_registry(args.registry)
         return resolve_baseline_path(
-            registry,
+            args.registry,
             suite_name=suite.name,
             baseline_name=args.baseline_name,
         )
@@ -604,9 +740,12 @@ def _resolve_baseline_arg(args: argparse.Namespace, suite: BenchmarkSuite) -> Pa
 
 
 def _policy_from_args(args: argparse.Namespace) -> StatisticalPolicy:
+    from refua_bench.compare import StatisticalPolicy
+
     min_effect_size = float(args.min_effect_size)
     bootstrap_resamples = int(args.bootstrap_resamples)
     confidence_level = float(args.confidence_level)
+    screen_sigmas = float(args.screen_sigmas)
 
     if min_effect_size < 0:
         raise ValueError("--min-effect-size must be >= 0")
@@ -614,6 +753,8 @@ def _policy_from_args(args: argparse.Namespace) -> StatisticalPolicy:
         raise ValueError("--bootstrap-resamples must be >= 0")
     if confidence_level <= 0 or confidence_level >= 1:
         raise ValueError("--confidence-level must be between 0 and 1")
+    if screen_sigmas < 0:
+        raise ValueError("--screen-sigmas must be >= 0")
 
     return StatisticalPolicy(
         min_effect_size=min_effect_size,
@@ -621,6 +762,9 @@ def _policy_from_args(args: argparse.Namespace) -> StatisticalPolicy:
         confidence_level=confidence_level,
         bootstrap_seed=args.bootstrap_seed,
         fail_on_uncertain=bool(args.fail_on_uncertain),
+        sequential_stopping=bool(args.sequential_stopping),
+        screen_sigmas=screen_sigmas,
+        share_resamples=bool(args.share_resamples),
     )
 
 
@@ -629,6 +773,8 @@ def _build_provenance(
     adapter_name: str,
     adapter_config: Mapping[str, Any],
 ) -> dict[str, Any]:
+    from refua_bench.provenance import collect_provenance
+
     if args.no_provenance:
         return {}
 
@@ -643,6 +789,7 @@ def _build_provenance(
         model_version=args.model_version,
         model_params=model_params,
         extra=provenance_extra,
+        fast=not args.full_provenance,
     )
 
 
@@ -653,22 +800,36 @@ def _mapping_or_none(value: Any) -> Mapping[str, Any] | None:
 
 
 def _load_optional_mapping(config_value: str | None) -> dict[str, Any]:
+    from refua_bench.schema import load_data_file
+
     if config_value is None:
         return {}
 
-    path = Path(config_value)
-    if path.exists():
-        payload = load_data_file(path)
-        return dict(payload)
+    # "@path" names a file outright; anything else is decoded as inline JSON
+    # without touching the filesystem.
+    if config_value.startswith("@"):
+        return load_data_file(config_value[1:])
 
     try:
-        parsed = json.loads(config_value)
-    except json.JSONDecodeError as exc:
-        raise ValueError(
-            "Expected a valid JSON object or existing YAML/JSON file path"
-        ) from exc
+        parsed = _json.loads(config_value)
+    except ValueError as exc:
+        parsed = exc
 
     if not isinstance(parsed, dict):
+        path = Path(config_value)
+        if path.exists():
+            import warnings
+
+            warnings.warn(
+                f"Passing a file path without '@' is deprecated; use '@{config_value}'",
+                FutureWarning,
+                stacklevel=2,
+            )
+            return load_data_file(path)
+        if isinstance(parsed, ValueError):
+            raise ValueError(
+                "Expected a valid JSON object or '@' followed by a YAML/JSON file path"
+            ) from parsed
         raise ValueError("Decoded JSON value must be an object")
 
     return parsed
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import math
 import random
-from dataclasses import asdict, dataclass
+import statistics
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
 from typing import Any
 
-from refua_bench.metrics import compute_metric, metric_direction
+from refua_bench.metrics import compute_metric, metric_direction, paired_resample_scorer
 from refua_bench.schema import BenchmarkSuite
 
 
@@ -15,6 +18,15 @@ class StatisticalPolicy:
     confidence_level: float = 0.95
     bootstrap_seed: int | None = None
     fail_on_uncertain: bool = False
+    # Stop resampling once the CI verdict can no longer change (see
+    # _bootstrap_group_stats); the reported bounds then come from fewer draws.
+    sequential_stopping: bool = False
+    # Decide tasks without resampling when the observed regression is this many
+    # standard errors from the threshold (see _screen_verdict); 0 disables it.
+    screen_sigmas: float = 0.0
+    # Score tasks with the same number of paired cases on one stream of index
+    # draws, seeded from the first such task, instead of one stream per task.
+    share_resamples: bool = False
 
     @property
     def bootstrap_enabled(self) -> bool:
@@ -38,6 +50,48 @@ class TaskComparison:
     paired_cases: int
     status: str
     message: str
+    resamples_used: int | None = None
+
+
+# ci_low, ci_high, p_regression, resamples_used
+_BootstrapStats = tuple[float, float, float, int]
+
+# baseline_expected, baseline_predicted, candidate_expected, candidate_predicted,
+# one entry per paired case.
+_PairedColumns = tuple[list[Any], list[Any], list[Any], list[Any]]
+
+_TASK_COMPARISON_FIELDS = tuple(item.name for item in fields(TaskComparison))
+
+# Metrics that score every resample of data they can score as a whole. Others
+# (enrichment factor, BEDROC) raise on resamples without positives, which the
+# bootstrap reports as a missing interval, so identical pairs still resample.
+_ALWAYS_SCORED_METRICS = frozenset({"mae", "rmse", "accuracy", "exact_match", "f1"})
+
+
+@dataclass(slots=True)
+class PreparedRun:
+    """A run artifact indexed for comparison.
+
+    ``compare_runs`` accepts these in place of raw run dicts, so a run compared
+    several times (e.g. under different policies) is indexed only once. The
+    underlying payload must not be modified while it is in use.
+    """
+
+    tasks: dict[str, dict[str, Any]]
+    _case_maps: dict[str, dict[str, dict[str, Any]]] = field(default_factory=dict)
+
+    def case_map(self, task_id: str) -> dict[str, dict[str, Any]]:
+        case_map = self._case_maps.get(task_id)
+        if case_map is None:
+            case_map = _case_map(self.tasks[task_id])
+            self._case_maps[task_id] = case_map
+        return case_map
+
+
+def prepare_run(run_payload: dict[str, Any] | PreparedRun) -> PreparedRun:
+    if isinstance(run_payload, PreparedRun):
+        return run_payload
+    return PreparedRun(tasks=_task_map(run_payload))
 
 
 @dataclass(slots=True)
@@ -49,38 +103,66 @@ class ComparisonReport:
     task_comparisons: list[TaskComparison]
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Equivalent to asdict(): every field is a scalar or a flat dict of
+        # scalars, so one level of copying is enough.
+        return {
+            "suite_name": self.suite_name,
+            "suite_version": self.suite_version,
+            "summary": dict(self.summary),
+            "policy": dict(self.policy),
+            "task_comparisons": [
+                {name: getattr(item, name) for name in _TASK_COMPARISON_FIELDS}
+                for item in self.task_comparisons
+            ],
+        }
+
+    def failed(self, fail_on_uncertain: bool) -> bool:
+        if self.summary["regressions"] > 0:
+            return True
+        return fail_on_uncertain and self.summary["uncertain"] > 0
 
 
 def compare_runs(
     suite: BenchmarkSuite,
-    baseline_run: dict[str, Any],
-    candidate_run: dict[str, Any],
+    baseline_run: dict[str, Any] | PreparedRun,
+    candidate_run: dict[str, Any] | PreparedRun,
     *,
     policy: StatisticalPolicy | None = None,
+    fast_path: bool = True,
+    workers: int = 1,
 ) -> ComparisonReport:
+    """Compare a candidate run against a baseline under ``policy``.
+
+    With ``fast_path`` the bootstrap is skipped for tasks whose paired cases are
+    identical in both runs and whose metric scores every resample (MAE, RMSE,
+    accuracy, exact match, F1): both runs then score the same on each resample, so
+    the interval and regression probability are exactly zero and no draws are
+    counted in ``resamples_used``. ``workers`` > 1 runs
+    the per-task bootstraps in that many processes; results do not depend on it.
+    """
     active_policy = StatisticalPolicy() if policy is None else policy
 
-    baseline_tasks = _task_map(baseline_run)
-    candidate_tasks = _task_map(candidate_run)
+    baseline_prepared = prepare_run(baseline_run)
+    candidate_prepared = prepare_run(candidate_run)
+    baseline_tasks = baseline_prepared.tasks
+    candidate_tasks = candidate_prepared.tasks
 
     comparisons: list[TaskComparison] = []
-    regressions = 0
-    uncertain = 0
+    bootstrap_jobs: list[tuple[TaskComparison, dict[str, Any]]] = []
 
     for task_index, task in enumerate(suite.tasks):
         baseline_task = baseline_tasks.get(task.task_id)
         candidate_task = candidate_tasks.get(task.task_id)
 
         threshold = max(task.regression_tolerance, active_policy.min_effect_size)
+        direction = metric_direction(task.metric)
 
         if baseline_task is None:
-            regressions += 1
             comparisons.append(
                 TaskComparison(
                     task_id=task.task_id,
                     metric=task.metric,
-                    direction=metric_direction(task.metric),
+                    direction=direction,
                     baseline_score=None,
                     candidate_score=_extract_score(candidate_task),
                     tolerance=task.regression_tolerance,
@@ -98,12 +180,11 @@ def compare_runs(
             continue
 
         if candidate_task is None:
-            regressions += 1
             comparisons.append(
                 TaskComparison(
                     task_id=task.task_id,
                     metric=task.metric,
-                    direction=metric_direction(task.metric),
+                    direction=direction,
                     baseline_score=_extract_score(baseline_task),
                     candidate_score=None,
                     tolerance=task.regression_tolerance,
@@ -124,12 +205,11 @@ def compare_runs(
         candidate_score = _extract_score(candidate_task)
 
         if baseline_score is None or candidate_score is None:
-            regressions += 1
             comparisons.append(
                 TaskComparison(
                     task_id=task.task_id,
                     metric=task.metric,
-                    direction=metric_direction(task.metric),
+                    direction=direction,
                     baseline_score=baseline_score,
                     candidate_score=candidate_score,
                     tolerance=task.regression_tolerance,
@@ -146,13 +226,9 @@ def compare_runs(
             )
             continue
 
-        direction = metric_direction(task.metric)
         delta = candidate_score - baseline_score
         regression_amount = delta if direction == "lower" else -delta
 
-        ci_low: float | None = None
-        ci_high: float | None = None
-        p_regression: float | None = None
         paired_cases = 0
 
         status = "pass"
@@ -162,64 +238,85 @@ def compare_runs(
             status = "regression"
             message = "Exceeded threshold"
 
+        bootstrap_job: dict[str, Any] | None = None
+        bootstrap_stats: _BootstrapStats | None = None
+        screen: tuple[str, str] | None = None
         if active_policy.bootstrap_enabled:
-            paired_cases_data = _paired_cases(baseline_task, candidate_task)
-            paired_cases = len(paired_cases_data)
-            bootstrap_stats = _bootstrap_regression_stats(
-                metric=task.metric,
-                direction=direction,
-                positive_label=task.positive_label,
-                enrichment_fraction=task.enrichment_fraction,
-                bedroc_alpha=task.bedroc_alpha,
-                pairs=paired_cases_data,
-                threshold=threshold,
-                resamples=active_policy.bootstrap_resamples,
-                confidence_level=active_policy.confidence_level,
-                seed=_seed_for_task(active_policy.bootstrap_seed, task_index),
-            )
-
-            if bootstrap_stats is not None:
-                ci_low, ci_high, p_regression = bootstrap_stats
-                if regression_amount <= threshold:
-                    status = "pass"
-                    message = "Within threshold"
-                elif ci_low > threshold:
-                    status = "regression"
-                    message = "Bootstrap CI confirms regression"
-                elif ci_high <= threshold:
-                    status = "pass"
-                    message = "Bootstrap CI rejects regression"
-                else:
-                    status = "uncertain"
-                    message = "Regression signal is inconclusive under bootstrap CI"
-            elif regression_amount > threshold:
-                status = "uncertain"
-                message = "Insufficient paired cases for bootstrap CI"
-
-        if status == "regression":
-            regressions += 1
-        elif status == "uncertain":
-            uncertain += 1
-
-        comparisons.append(
-            TaskComparison(
-                task_id=task.task_id,
-                metric=task.metric,
-                direction=direction,
-                baseline_score=baseline_score,
-                candidate_score=candidate_score,
-                tolerance=task.regression_tolerance,
-                threshold=threshold,
-                delta=delta,
-                regression_amount=regression_amount,
-                ci_low=ci_low,
-                ci_high=ci_high,
-                p_regression=p_regression,
-                paired_cases=paired_cases,
-                status=status,
-                message=message,
+            paired_cases_data = _paired_cases(
+                baseline_prepared.case_map(task.task_id),
+                candidate_prepared.case_map(task.task_id),
             )
+            paired_cases = len(paired_cases_data[0])
+            if (
+                fast_path
+                and paired_cases >= 2
+                and _pairs_identical(paired_cases_data)
+                and _resamples_always_score(task.metric, paired_cases_data)
+            ):
+                bootstrap_stats = (0.0, 0.0, 0.0, 0)
+            elif active_policy.screen_sigmas > 0 and paired_cases >= 2:
+                screen = _screen_verdict(
+                    task.metric,
+                    direction,
+                    paired_cases_data,
+                    regression_amount=regression_amount,
+                    threshold=threshold,
+                    sigmas=active_policy.screen_sigmas,
+                )
+            if bootstrap_stats is None and screen is None:
+                bootstrap_job = {
+                    "metric": task.metric,
+                    "direction": direction,
+                    "positive_label": task.positive_label,
+                    "enrichment_fraction": task.enrichment_fraction,
+                    "bedroc_alpha": task.bedroc_alpha,
+                    "pairs": paired_cases_data,
+                    "threshold": threshold,
+                    "resamples": active_policy.bootstrap_resamples,
+                    "confidence_level": active_policy.confidence_level,
+                    "seed": _seed_for_task(active_policy.bootstrap_seed, task_index),
+                    "sequential_stopping": active_policy.sequential_stopping,
+                }
+
+        comparison = TaskComparison(
+            task_id=task.task_id,
+            metric=task.metric,
+            direction=direction,
+            baseline_score=baseline_score,
+            candidate_score=candidate_score,
+            tolerance=task.regression_tolerance,
+            threshold=threshold,
+            delta=delta,
+            regression_amount=regression_amount,
+            ci_low=None,
+            ci_high=None,
+            p_regression=None,
+            paired_cases=paired_cases,
+            status=status,
+            message=message,
         )
+        comparisons.append(comparison)
+        if bootstrap_job is not None:
+            bootstrap_jobs.append((comparison, bootstrap_job))
+        elif screen is not None:
+            comparison.status, comparison.message = screen
+            comparison.resamples_used = 0
+        elif active_policy.bootstrap_enabled:
+            _apply_bootstrap(comparison, bootstrap_stats)
+
+    # Tasks (or, when resamples are shared, groups of tasks) resample independently
+    # with their own seeds, so running them in worker processes gives the same
+    # results as running them in order.
+    job_results = _run_bootstrap_jobs(
+        [job for _, job in bootstrap_jobs],
+        workers=workers,
+        share_resamples=active_policy.share_resamples,
+    )
+    for (comparison, _), stats in zip(bootstrap_jobs, job_results, strict=True):
+        _apply_bootstrap(comparison, stats)
+
+    regressions = sum(1 for item in comparisons if item.status == "regression")
+    uncertain = sum(1 for item in comparisons if item.status == "uncertain")
 
     passed = regressions == 0 and (
         uncertain == 0 if active_policy.fail_on_uncertain else True
@@ -237,6 +334,9 @@ def compare_runs(
         "confidence_level": active_policy.confidence_level,
         "bootstrap_seed": active_policy.bootstrap_seed,
         "fail_on_uncertain": active_policy.fail_on_uncertain,
+        "sequential_stopping": active_policy.sequential_stopping,
+        "screen_sigmas": active_policy.screen_sigmas,
+        "share_resamples": active_policy.share_resamples,
     }
 
     return ComparisonReport(
@@ -248,6 +348,124 @@ def compare_runs(
     )
 
 
+def _apply_bootstrap(
+    comparison: TaskComparison, bootstrap_stats: _BootstrapStats | None
+) -> None:
+    # Only called for tasks with both scores, so regression_amount is set.
+    regression_amount = comparison.regression_amount or 0.0
+    threshold = comparison.threshold
+
+    if bootstrap_stats is not None:
+        ci_low, ci_high, p_regression, resamples_used = bootstrap_stats
+        comparison.resamples_used = resamples_used
+        comparison.ci_low = ci_low
+        comparison.ci_high = ci_high
+        comparison.p_regression = p_regression
+        if regression_amount <= threshold:
+            comparison.status = "pass"
+            comparison.message = "Within threshold"
+        elif ci_low > threshold:
+            comparison.status = "regression"
+            comparison.message = "Bootstrap CI confirms regression"
+        elif ci_high <= threshold:
+            comparison.status = "pass"
+            comparison.message = "Bootstrap CI rejects regression"
+        else:
+            comparison.status = "uncertain"
+            comparison.message = "Regression signal is inconclusive under bootstrap CI"
+    elif regression_amount > threshold:
+        comparison.status = "uncertain"
+        comparison.message = "Insufficient paired cases for bootstrap CI"
+
+
+def _screen_verdict(
+    metric: str,
+    direction: str,
+    pairs: _PairedColumns,
+    *,
+    regression_amount: float,
+    threshold: float,
+    sigmas: float,
+) -> tuple[str, str] | None:
+    # A normal approximation to the bootstrap: for metrics that are a mean of
+    # per-case terms, the regression is the mean of per-case differences, with
+    # standard error stdev / sqrt(n). When the mean is more than `sigmas` standard
+    # errors from the threshold the bootstrap CI would land on the same side, so
+    # it is skipped. Other metrics, and anything undecided, are resampled.
+    terms = _case_regressions(metric, direction, pairs)
+    if terms is None:
+        return None
+    mean = statistics.fmean(terms)
+    margin = sigmas * statistics.stdev(terms, mean) / math.sqrt(len(terms))
+    if mean + margin <= threshold:
+        return "pass", "Standard-error screen rejects regression"
+    if regression_amount > threshold and mean - margin > threshold:
+        return "regression", "Standard-error screen confirms regression"
+    return None
+
+
+def _resamples_always_score(metric: str, pairs: _PairedColumns) -> bool:
+    if metric not in _ALWAYS_SCORED_METRICS:
+        return False
+    # MAE and RMSE still raise on non-numeric values; a resample only draws
+    # values from the full columns, so scoring those once covers every draw.
+    try:
+        compute_metric(metric, pairs[0], pairs[1])
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _case_regressions(
+    metric: str, direction: str, pairs: _PairedColumns
+) -> list[float] | None:
+    if metric == "mae":
+        try:
+            terms = [
+                abs(float(c_exp) - float(c_pred)) - abs(float(b_exp) - float(b_pred))
+                for b_exp, b_pred, c_exp, c_pred in zip(*pairs, strict=True)
+            ]
+        except (TypeError, ValueError):
+            return None
+    elif metric in {"accuracy", "exact_match"}:
+        terms = [
+            float((c_exp == c_pred) - (b_exp == b_pred))
+            for b_exp, b_pred, c_exp, c_pred in zip(*pairs, strict=True)
+        ]
+    else:
+        return None
+    if direction == "lower":
+        return terms
+    return [-term for term in terms]
+
+
+def _run_bootstrap_jobs(
+    jobs: list[dict[str, Any]], *, workers: int, share_resamples: bool = False
+) -> list[_BootstrapStats | None]:
+    if share_resamples:
+        by_size: dict[int, list[int]] = {}
+        for position, job in enumerate(jobs):
+            by_size.setdefault(len(job["pairs"][0]), []).append(position)
+        groups = list(by_size.values())
+    else:
+        groups = [[position] for position in range(len(jobs))]
+    group_jobs = [[jobs[position] for position in group] for group in groups]
+
+    if workers <= 1 or len(group_jobs) < 2:
+        group_results = [_bootstrap_group_stats(batch) for batch in group_jobs]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(group_jobs))) as executor:
+            group_results = list(executor.map(_bootstrap_group_stats, group_jobs))
+
+    results: list[_BootstrapStats | None] = [None] * len(jobs)
+    for group, batch_results in zip(groups, group_results, strict=True):
+        for position, stats in zip(group, batch_results, strict=True):
+            results[position] = stats
+    return results
+
+
 def _seed_for_task(seed: int | None, task_index: int) -> int | None:
     if seed is None:
         return None
@@ -273,6 +491,9 @@ def _extract_score(task_payload: dict[str, Any] | None) -> float | None:
     if not isinstance(task_payload, dict):
         return None
     score = task_payload.get("score")
+    if type(score) is float:
+        # Decoded JSON scores are almost always floats already.
+        return score
     if score is None:
         return None
     try:
@@ -282,13 +503,15 @@ def _extract_score(task_payload: dict[str, Any] | None) -> float | None:
 
 
 def _paired_cases(
-    baseline_task: dict[str, Any],
-    candidate_task: dict[str, Any],
-) -> list[tuple[Any, Any, Any, Any]]:
-    baseline_cases = _case_map(baseline_task)
-    candidate_cases = _case_map(candidate_task)
-
-    pairs: list[tuple[Any, Any, Any, Any]] = []
+    baseline_cases: dict[str, dict[str, Any]],
+    candidate_cases: dict[str, dict[str, Any]],
+) -> _PairedColumns:
+    # Built column-wise so the bootstrap and the screen read the per-run value
+    # lists directly instead of unpacking a list of tuples.
+    baseline_expected: list[Any] = []
+    baseline_predicted: list[Any] = []
+    candidate_expected: list[Any] = []
+    candidate_predicted: list[Any] = []
     for case_id, baseline_case in baseline_cases.items():
         candidate_case = candidate_cases.get(case_id)
         if candidate_case is None:
@@ -300,26 +523,27 @@ def _paired_cases(
         ):
             continue
 
-        baseline_expected = baseline_case.get("expected")
-        baseline_predicted = baseline_case.get("predicted")
-        candidate_expected = candidate_case.get("expected")
-        candidate_predicted = candidate_case.get("predicted")
+        b_expected = baseline_case.get("expected")
+        b_predicted = baseline_case.get("predicted")
+        c_expected = candidate_case.get("expected")
+        c_predicted = candidate_case.get("predicted")
 
-        if baseline_expected is None or baseline_predicted is None:
+        if b_expected is None or b_predicted is None:
             continue
-        if candidate_expected is None or candidate_predicted is None:
+        if c_expected is None or c_predicted is None:
             continue
 
-        pairs.append(
-            (
-                baseline_expected,
-                baseline_predicted,
-                candidate_expected,
-                candidate_predicted,
-            )
-        )
+        baseline_expected.append(b_expected)
+        baseline_predicted.append(b_predicted)
+        candidate_expected.append(c_expected)
+        candidate_predicted.append(c_predicted)
+
+    return baseline_expected, baseline_predicted, candidate_expected, candidate_predicted
 
-    return pairs
+
+def _pairs_identical(pairs: _PairedColumns) -> bool:
+    baseline_expected, baseline_predicted, candidate_expected, candidate_predicted = pairs
+    return baseline_expected == candidate_expected and baseline_predicted == candidate_predicted
 
 
 def _case_map(task_payload: dict[str, Any]) -> dict[str, dict[str, Any]]:
@@ -337,80 +561,143 @@ def _case_map(task_payload: dict[str, Any]) -> dict[str, dict[str, Any]]:
     return case_map
 
 
-def _bootstrap_regression_stats(
-    *,
-    metric: str,
-    direction: str,
-    positive_label: Any,
-    enrichment_fraction: float,
-    bedroc_alpha: float,
-    pairs: list[tuple[Any, Any, Any, Any]],
-    threshold: float,
-    resamples: int,
-    confidence_level: float,
-    seed: int | None,
-) -> tuple[float, float, float] | None:
-    if len(pairs) < 2 or resamples <= 0:
-        return None
-
-    rng = random.Random(seed)
-    n_cases = len(pairs)
-
-    baseline_expected = [item[0] for item in pairs]
-    baseline_predicted = [item[1] for item in pairs]
-    candidate_expected = [item[2] for item in pairs]
-    candidate_predicted = [item[3] for item in pairs]
-
-    regression_samples: list[float] = []
-    regression_hits = 0
-
-    for _ in range(resamples):
-        indices = [rng.randrange(n_cases) for _ in range(n_cases)]
-
-        b_expected = [baseline_expected[idx] for idx in indices]
-        b_predicted = [baseline_predicted[idx] for idx in indices]
-        c_expected = [candidate_expected[idx] for idx in indices]
-        c_predicted = [candidate_predicted[idx] for idx in indices]
-
-        try:
-            baseline_score = compute_metric(
-                metric,
-                b_expected,
-                b_predicted,
-                positive_label=positive_label,
-                enrichment_fraction=enrichment_fraction,
-                bedroc_alpha=bedroc_alpha,
-            )
-            candidate_score = compute_metric(
-                metric,
-                c_expected,
-                c_predicted,
-                positive_label=positive_label,
-                enrichment_fraction=enrichment_fraction,
-                bedroc_alpha=bedroc_alpha,
-            )
-        except ValueError:
-            return None
+def _bootstrap_group_stats(jobs: list[dict[str, Any]]) -> list[_BootstrapStats | None]:
+    # Every job in a group has the same number of paired cases and the same
+    # resampling settings; all of them are scored on one stream of index draws
+    # seeded from the first job. A single-job group is the plain per-task bootstrap.
+    first = jobs[0]
+    n_cases = len(first["pairs"][0])
+    resamples = first["resamples"]
+    results: list[_BootstrapStats | None] = [None] * len(jobs)
+    if n_cases < 2 or resamples <= 0:
+        return results
+
+    rng = random.Random(first["seed"])
+    scorers = [_pair_scorer(job) for job in jobs]
+    samples: list[list[float]] = [[] for _ in jobs]
+    hits = [0] * len(jobs)
+    failed: set[int] = set()
+    active = list(range(len(jobs)))
+
+    # Each resample's indices come from one choices() call, which draws them in a
+    # single C-level loop over random() instead of n_cases randrange() calls.
+    choices = rng.choices
+    case_indices = range(n_cases)
+
+    alpha = 1.0 - first["confidence_level"]
+    check_interval = max(200, resamples // 20)
+    check_settled = first["sequential_stopping"] and alpha > 0
+
+    for draw in range(1, resamples + 1):
+        indices = choices(case_indices, k=n_cases)
+        check = check_settled and draw % check_interval == 0 and draw < resamples
+
+        still_active: list[int] = []
+        for position in active:
+            job = jobs[position]
+            try:
+                baseline_score, candidate_score = scorers[position](indices)
+            except ValueError:
+                failed.add(position)
+                continue
+
+            delta = candidate_score - baseline_score
+            regression_amount = delta if job["direction"] == "lower" else -delta
+            samples[position].append(regression_amount)
+            if regression_amount > job["threshold"]:
+                hits[position] += 1
+
+            if check and _ci_verdict_settled(
+                sorted(samples[position]), alpha, job["threshold"]
+            ):
+                continue
+            still_active.append(position)
+
+        active = still_active
+        if not active:
+            break
+
+    for position, regression_samples in enumerate(samples):
+        if position in failed:
+            continue
+        # Sort once (in place; the samples are not used afterwards) for both bounds.
+        regression_samples.sort()
+        ci_low = _quantile(regression_samples, alpha / 2.0)
+        ci_high = _quantile(regression_samples, 1.0 - (alpha / 2.0))
+        p_regression = hits[position] / len(regression_samples)
+        results[position] = (ci_low, ci_high, p_regression, len(regression_samples))
+
+    return results
+
+
+def _pair_scorer(job: dict[str, Any]) -> Callable[[list[int]], tuple[float, float]]:
+    metric = job["metric"]
+    positive_label = job["positive_label"]
+    baseline_expected, baseline_predicted, candidate_expected, candidate_predicted = job[
+        "pairs"
+    ]
+
+    # Additive metrics are scored from per-case terms computed once; the index
+    # draws are unchanged, so results match the generic path exactly.
+    scorer = paired_resample_scorer(
+        metric,
+        (baseline_expected, baseline_predicted),
+        (candidate_expected, candidate_predicted),
+        positive_label=positive_label,
+    )
+    if scorer is not None:
+        return scorer
+
+    enrichment_fraction = job["enrichment_fraction"]
+    bedroc_alpha = job["bedroc_alpha"]
+    # One buffer per value list is refilled in place for every resample.
+    b_expected: list[Any] = []
+    b_predicted: list[Any] = []
+    c_expected: list[Any] = []
+    c_predicted: list[Any] = []
+
+    def _score(indices: list[int]) -> tuple[float, float]:
+        b_expected[:] = map(baseline_expected.__getitem__, indices)
+        b_predicted[:] = map(baseline_predicted.__getitem__, indices)
+        c_expected[:] = map(candidate_expected.__getitem__, indices)
+        c_predicted[:] = map(candidate_predicted.__getitem__, indices)
+        baseline_score = compute_metric(
+            metric,
+            b_expected,
+            b_predicted,
+            positive_label=positive_label,
+            enrichment_fraction=enrichment_fraction,
+            bedroc_alpha=bedroc_alpha,
+        )
+        candidate_score = compute_metric(
+            metric,
+            c_expected,
+            c_predicted,
+            positive_label=positive_label,
+            enrichment_fraction=enrichment_fraction,
+            bedroc_alpha=bedroc_alpha,
+        )
+        return baseline_score, candidate_score
 
-        delta = candidate_score - baseline_score
-        regression_amount = delta if direction == "lower" else -delta
-        regression_samples.append(regression_amount)
-        if regression_amount > threshold:
-            regression_hits += 1
+    return _score
 
-    alpha = 1.0 - confidence_level
-    ci_low = _quantile(regression_samples, alpha / 2.0)
-    ci_high = _quantile(regression_samples, 1.0 - (alpha / 2.0))
-    p_regression = regression_hits / len(regression_samples)
 
-    return ci_low, ci_high, p_regression
+def _ci_verdict_settled(sorted_samples: list[float], alpha: float, threshold: float) -> bool:
+    # By the Dvoretzky-Kiefer-Wolfowitz inequality the empirical CDF of n draws is
+    # within eps of the bootstrap distribution with probability 1 - alpha.
+    # Widening both quantile levels by eps gives conservative bounds; once they sit
+    # on one side of the threshold, more draws are unlikely to flip the CI verdict.
+    eps = math.sqrt(math.log(2.0 / alpha) / (2.0 * len(sorted_samples)))
+    low = _quantile(sorted_samples, alpha / 2.0 - eps)
+    high = _quantile(sorted_samples, 1.0 - alpha / 2.0 + eps)
+    return low > threshold or high <= threshold
 
 
-def _quantile(values: list[float], probability: float) -> float:
-    if not values:
+def _quantile(sorted_values: list[float], probability: float) -> float:
+    # Linear interpolation between closest ranks; values must already be sorted.
+    if not sorted_values:
         raise ValueError("Cannot compute quantile on empty values")
 
-    sorted_values = sorted(values)
     if probability <= 0:
         return sorted_values[0]
     if probability >= 1:
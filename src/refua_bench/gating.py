@@ -4,10 +4,10 @@ from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
-from refua_bench.adapters import load_adapter
+from refua_bench.adapters import close_adapter, load_adapter
 from refua_bench.compare import StatisticalPolicy, compare_runs
-from refua_bench.reporting import read_json, write_json
-from refua_bench.run_artifact import validate_run_artifact
+from refua_bench.reporting import write_json
+from refua_bench.run_artifact import load_and_validate_run_artifact, validate_run_artifact
 from refua_bench.runner import run_benchmark
 from refua_bench.schema import load_suite
 
@@ -27,14 +27,17 @@ def gate_suite(
     suite = load_suite(suite_path)
     adapter = load_adapter(adapter_spec, adapter_config)
 
-    candidate_run = run_benchmark(
-        suite,
-        adapter,
-        provenance=None if provenance is None else dict(provenance),
-    ).to_dict()
+    try:
+        candidate_run = run_benchmark(
+            suite,
+            adapter,
+            provenance=None if provenance is None else dict(provenance),
+        ).to_dict()
+    finally:
+        close_adapter(adapter)
 
-    baseline_run = validate_run_artifact(
-        read_json(baseline_run_path),
+    baseline_run = load_and_validate_run_artifact(
+        baseline_run_path,
         source=f"baseline run artifact '{baseline_run_path}'",
         suite=suite,
     )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from itertools import repeat
+from operator import eq, sub
 from typing import Any, Literal
 
 MetricDirection = Literal["higher", "lower"]
@@ -39,54 +41,246 @@ def compute_metric(
     if not expected_values:
         raise ValueError("Cannot compute a metric on empty values")
 
-    if metric == "mae":
-        expected = _to_float_list(expected_values)
-        predicted = _to_float_list(predicted_values)
-        absolute_errors = [
-            abs(exp - pred) for exp, pred in zip(expected, predicted, strict=True)
-        ]
-        return sum(absolute_errors) / len(expected)
+    try:
+        metric_func = _METRIC_FUNCS[metric]
+    except KeyError:
+        raise ValueError(f"Unsupported metric: {metric}") from None
+    return metric_func(
+        expected_values,
+        predicted_values,
+        positive_label=positive_label,
+        enrichment_fraction=enrichment_fraction,
+        bedroc_alpha=bedroc_alpha,
+    )
+
+
+def _mae(
+    expected_values: Sequence[Any], predicted_values: Sequence[Any], **_: Any
+) -> float:
+    expected = _to_float_list(expected_values)
+    predicted = _to_float_list(predicted_values)
+    # compute_metric has checked the lengths; the reductions below run as
+    # C-level map() chains instead of per-case Python loops.
+    return sum(map(abs, map(sub, expected, predicted))) / len(expected)
+
+
+def _rmse(
+    expected_values: Sequence[Any], predicted_values: Sequence[Any], **_: Any
+) -> float:
+    expected = _to_float_list(expected_values)
+    predicted = _to_float_list(predicted_values)
+    # pow(x, 2) rather than x * x: the two can differ in the last bit.
+    squared_errors = map(pow, map(sub, expected, predicted), repeat(2))
+    mse = sum(squared_errors) / len(expected)
+    return math.sqrt(mse)
 
-    if metric == "rmse":
-        expected = _to_float_list(expected_values)
-        predicted = _to_float_list(predicted_values)
+
+def _accuracy(
+    expected_values: Sequence[Any], predicted_values: Sequence[Any], **_: Any
+) -> float:
+    matches = sum(map(bool, map(eq, expected_values, predicted_values)))
+    return matches / len(expected_values)
+
+
+def _f1(
+    expected_values: Sequence[Any],
+    predicted_values: Sequence[Any],
+    *,
+    positive_label: Any,
+    **_: Any,
+) -> float:
+    return _f1_binary(expected_values, predicted_values, positive_label=positive_label)
+
+
+def _ef(
+    expected_values: Sequence[Any],
+    predicted_values: Sequence[Any],
+    *,
+    positive_label: Any,
+    enrichment_fraction: float,
+    **_: Any,
+) -> float:
+    return _enrichment_factor(
+        expected_values,
+        predicted_values,
+        positive_label=positive_label,
+        enrichment_fraction=enrichment_fraction,
+    )
+
+
+def _bedroc_metric(
+    expected_values: Sequence[Any],
+    predicted_values: Sequence[Any],
+    *,
+    positive_label: Any,
+    bedroc_alpha: float,
+    **_: Any,
+) -> float:
+    return _bedroc(
+        expected_values,
+        predicted_values,
+        positive_label=positive_label,
+        alpha=bedroc_alpha,
+    )
+
+
+# One lookup per call instead of walking a chain of string comparisons.
+_METRIC_FUNCS: dict[str, Callable[..., float]] = {
+    "mae": _mae,
+    "rmse": _rmse,
+    "accuracy": _accuracy,
+    "exact_match": _accuracy,
+    "f1": _f1,
+    "enrichment_factor": _ef,
+    "ef": _ef,
+    "bedroc": _bedroc_metric,
+}
+
+
+def resample_scorer(
+    metric: str,
+    expected_values: Sequence[Any],
+    predicted_values: Sequence[Any],
+    *,
+    positive_label: Any = 1,
+) -> Callable[[Sequence[int]], float] | None:
+    """Return a function scoring the cases at the given indices, or None.
+
+    For metrics that are a sum of per-case terms, the terms are computed once and
+    each resample only gathers and sums them, giving the same result as calling
+    ``compute_metric`` on the resampled values. Rank-based metrics, and values
+    ``compute_metric`` would reject, return None.
+    """
+    if len(expected_values) != len(predicted_values) or not expected_values:
+        return None
+
+    if metric in {"mae", "rmse"}:
+        try:
+            expected = _to_float_list(expected_values)
+            predicted = _to_float_list(predicted_values)
+        except ValueError:
+            return None
+        if metric == "mae":
+            absolute_errors = [
+                abs(exp - pred) for exp, pred in zip(expected, predicted, strict=True)
+            ]
+            return lambda indices: sum(map(absolute_errors.__getitem__, indices)) / len(
+                indices
+            )
         squared_errors = [
             (exp - pred) ** 2 for exp, pred in zip(expected, predicted, strict=True)
         ]
-        mse = sum(squared_errors) / len(expected)
-        return math.sqrt(mse)
+        return lambda indices: math.sqrt(
+            sum(map(squared_errors.__getitem__, indices)) / len(indices)
+        )
 
     if metric in {"accuracy", "exact_match"}:
-        matches = sum(
-            1
+        matches = [
+            1 if exp == pred else 0
             for exp, pred in zip(expected_values, predicted_values, strict=True)
-            if exp == pred
-        )
-        return matches / len(expected_values)
+        ]
+        return lambda indices: sum(map(matches.__getitem__, indices)) / len(indices)
 
     if metric == "f1":
-        return _f1_binary(
-            expected_values, predicted_values, positive_label=positive_label
-        )
-    if metric in {"enrichment_factor", "ef"}:
-        return _enrichment_factor(
-            expected_values,
-            predicted_values,
-            positive_label=positive_label,
-            enrichment_fraction=enrichment_fraction,
-        )
-    if metric == "bedroc":
-        return _bedroc(
-            expected_values,
-            predicted_values,
-            positive_label=positive_label,
-            alpha=bedroc_alpha,
-        )
+        outcomes = _f1_outcomes(expected_values, predicted_values, positive_label)
+
+        def _score(indices: Sequence[int]) -> float:
+            counts = [0, 0, 0, 0]
+            for index in indices:
+                counts[outcomes[index]] += 1
+            return _f1_from_counts(counts[0], counts[1], counts[2])
+
+        return _score
+
+    return None
+
+
+def paired_resample_scorer(
+    metric: str,
+    baseline: tuple[Sequence[Any], Sequence[Any]],
+    candidate: tuple[Sequence[Any], Sequence[Any]],
+    *,
+    positive_label: Any = 1,
+) -> Callable[[Sequence[int]], tuple[float, float]] | None:
+    """Like ``resample_scorer``, scoring two runs on the same resampled indices.
+
+    ``baseline`` and ``candidate`` are ``(expected, predicted)`` pairs of the same
+    length. For count-based metrics each case's baseline and candidate outcomes
+    are packed into one code, so a single counting pass over the indices yields
+    the sufficient statistics of both runs.
+    """
+    if len(baseline[0]) != len(candidate[0]):
+        return None
+
+    if metric in {"accuracy", "exact_match", "f1"}:
+        if (
+            not baseline[0]
+            or len(baseline[0]) != len(baseline[1])
+            or len(candidate[0]) != len(candidate[1])
+        ):
+            return None
+        if metric == "f1":
+            baseline_codes = _f1_outcomes(*baseline, positive_label)
+            candidate_codes = _f1_outcomes(*candidate, positive_label)
+        else:
+            baseline_codes = [int(exp == pred) for exp, pred in zip(*baseline, strict=True)]
+            candidate_codes = [int(exp == pred) for exp, pred in zip(*candidate, strict=True)]
+        paired_codes = [
+            (b_code << 2) | c_code
+            for b_code, c_code in zip(baseline_codes, candidate_codes, strict=True)
+        ]
 
-    raise ValueError(f"Unsupported metric: {metric}")
+        def _score_pair(indices: Sequence[int]) -> tuple[float, float]:
+            # A bincount over the 16 paired codes, then folded per run; a plain
+            # loop into a list beats Counter for these small integer keys.
+            paired_counts = [0] * 16
+            for index in indices:
+                paired_counts[paired_codes[index]] += 1
+            baseline_counts = [0, 0, 0, 0]
+            candidate_counts = [0, 0, 0, 0]
+            for code, count in enumerate(paired_counts):
+                baseline_counts[code >> 2] += count
+                candidate_counts[code & 3] += count
+            if metric == "f1":
+                return (
+                    _f1_from_counts(*baseline_counts[:3]),
+                    _f1_from_counts(*candidate_counts[:3]),
+                )
+            return baseline_counts[1] / len(indices), candidate_counts[1] / len(indices)
+
+        return _score_pair
+
+    baseline_scorer = resample_scorer(metric, *baseline, positive_label=positive_label)
+    candidate_scorer = resample_scorer(metric, *candidate, positive_label=positive_label)
+    if baseline_scorer is None or candidate_scorer is None:
+        return None
+    return lambda indices: (baseline_scorer(indices), candidate_scorer(indices))
+
+
+def _f1_outcomes(
+    expected: Sequence[Any], predicted: Sequence[Any], positive_label: Any
+) -> list[int]:
+    # 0: true positive, 1: false positive, 2: false negative, 3: true negative.
+    return [
+        _f1_outcome(exp == positive_label, pred == positive_label)
+        for exp, pred in zip(expected, predicted, strict=True)
+    ]
+
+
+def _f1_outcome(exp_positive: bool, pred_positive: bool) -> int:
+    if pred_positive:
+        return 0 if exp_positive else 1
+    return 2 if exp_positive else 3
 
 
 def _to_float_list(values: Sequence[Any]) -> list[float]:
+    # Convert in one C-level pass; the per-value loop only runs to name the
+    # offending value when conversion fails.
+    try:
+        return list(map(float, values))
+    except (TypeError, ValueError):
+        pass
+
     result: list[float] = []
     for value in values:
         try:
@@ -113,6 +307,10 @@ def _f1_binary(
         elif exp_positive and (not pred_positive):
             false_negative += 1
 
+    return _f1_from_counts(true_positive, false_positive, false_negative)
+
+
+def _f1_from_counts(true_positive: int, false_positive: int, false_negative: int) -> float:
     if true_positive == 0 and false_positive == 0 and false_negative == 0:
         return 1.0
 
@@ -5,11 +5,15 @@ import os
 import platform
 import socket
 import subprocess
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+_TRACKED_DEPENDENCIES = ("refua-bench", "refua", "refua-mcp", "pyyaml")
+
 
 def collect_provenance(
     *,
@@ -21,13 +25,22 @@ def collect_provenance(
     model_params: Mapping[str, Any] | None = None,
     extra: Mapping[str, Any] | None = None,
     cwd: str | Path | None = None,
+    fast: bool = True,
 ) -> dict[str, Any]:
+    """Capture runtime, git, model and dependency details for a run artifact.
+
+    With ``fast`` (the default) the machine-constant runtime details and installed
+    dependency versions are read once per process, and the git commit is reused
+    until ``.git/HEAD``, the index or the current branch ref changes; whether the
+    work tree is dirty is always queried. Pass ``fast=False`` to query everything
+    afresh.
+    """
     base_dir = Path(cwd) if cwd is not None else Path.cwd()
 
     return {
         "captured_at": datetime.now(UTC).isoformat(),
-        "runtime": _runtime_info(),
-        "git": _git_info(base_dir),
+        "runtime": dict(_static_runtime_info()) if fast else _runtime_info(),
+        "git": _git_info(base_dir, cached=fast),
         "model": {
             "name": model_name or adapter_name,
             "version": model_version,
@@ -36,14 +49,7 @@ def collect_provenance(
             "adapter_config": {} if adapter_config is None else dict(adapter_config),
             "params": {} if model_params is None else dict(model_params),
         },
-        "dependencies": _dependency_versions(
-            [
-                "refua-bench",
-                "refua",
-                "refua-mcp",
-                "pyyaml",
-            ]
-        ),
+        "dependencies": _dependency_versions(_TRACKED_DEPENDENCIES, cached=fast),
         "extra": {} if extra is None else dict(extra),
     }
 
@@ -60,16 +66,62 @@ def _runtime_info() -> dict[str, Any]:
     }
 
 
-def _git_info(cwd: Path) -> dict[str, Any]:
-    head = _run_git(["rev-parse", "HEAD"], cwd)
-    if head is None:
+@lru_cache(maxsize=1)
+def _static_runtime_info() -> dict[str, Any]:
+    # Shared between calls; collect_provenance hands out copies.
+    return _runtime_info()
+
+
+def _git_state_key(cwd: Path) -> tuple[str, int, int | None, int | None] | None:
+    resolved = cwd.resolve()
+    for directory in (resolved, *resolved.parents):
+        git_dir = directory / ".git"
+        head_path = git_dir / "HEAD"
+        try:
+            head_mtime_ns = os.stat(head_path).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            # Worktrees and submodules use a .git file; those are not cached.
+            if git_dir.exists():
+                return None
+            continue
+        try:
+            index_mtime_ns: int | None = os.stat(git_dir / "index").st_mtime_ns
+        except FileNotFoundError:
+            index_mtime_ns = None
+        return str(resolved), head_mtime_ns, index_mtime_ns, _ref_mtime_ns(git_dir, head_path)
+    return None
+
+
+def _ref_mtime_ns(git_dir: Path, head_path: Path) -> int | None:
+    # A commit on a branch moves the branch ref, not HEAD itself.
+    try:
+        head = head_path.read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return None
+        ref_path = git_dir / head[5:]
+        if not ref_path.exists():
+            ref_path = git_dir / "packed-refs"
+        return os.stat(ref_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _git_info(cwd: Path, *, cached: bool = False) -> dict[str, Any]:
+    # The commit lookup runs alongside the status query rather than after it. Only
+    # the commit and root are ever cached: edits to tracked files touch neither
+    # HEAD nor the index, so the status query runs on every call.
+    lookup = _cached_git_commit_and_root if cached else _git_commit_and_root
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        commit_future = executor.submit(lookup, cwd)
+        status_future = executor.submit(_run_git, ["status", "--porcelain"], cwd)
+        commit_and_root = commit_future.result()
+        status = status_future.result()
+
+    if commit_and_root is None:
         return {
             "available": False,
         }
-
-    root = _run_git(["rev-parse", "--show-toplevel"], cwd)
-    status = _run_git(["status", "--porcelain"], cwd)
-
+    head, root = commit_and_root
     return {
         "available": True,
         "commit": head,
@@ -78,6 +130,37 @@ def _git_info(cwd: Path) -> dict[str, Any]:
     }
 
 
+def _cached_git_commit_and_root(cwd: Path) -> tuple[str, str | None] | None:
+    key = _git_state_key(cwd)
+    if key is None:
+        return _git_commit_and_root(cwd)
+    return _git_commit_and_root_for_state(*key)
+
+
+@lru_cache(maxsize=8)
+def _git_commit_and_root_for_state(
+    cwd: str, head_mtime_ns: int, index_mtime_ns: int | None, ref_mtime_ns: int | None
+) -> tuple[str, str | None] | None:
+    # The mtimes only key the cache: a checkout, commit or reset touches HEAD, the
+    # index or the current branch ref, so the commit is looked up again.
+    return _git_commit_and_root(Path(cwd))
+
+
+def _git_commit_and_root(cwd: Path) -> tuple[str, str | None] | None:
+    # One rev-parse prints the commit and the top level on separate lines.
+    rev_parse = _run_git(["rev-parse", "HEAD", "--show-toplevel"], cwd)
+    if rev_parse is not None:
+        head, _, root = rev_parse.partition("\n")
+        return head, root
+
+    # --show-toplevel fails outside a work tree (e.g. bare repositories),
+    # which fails the whole call; the commit may still be available.
+    head_only = _run_git(["rev-parse", "HEAD"], cwd)
+    if head_only is None:
+        return None
+    return head_only, None
+
+
 def _run_git(args: list[str], cwd: Path) -> str | None:
     completed = subprocess.run(
         ["git", *args],
@@ -91,11 +174,18 @@ def _run_git(args: list[str], cwd: Path) -> str | None:
     return completed.stdout.strip()
 
 
-def _dependency_versions(names: list[str]) -> dict[str, str]:
-    versions: dict[str, str] = {}
-    for package_name in names:
-        try:
-            versions[package_name] = importlib.metadata.version(package_name)
-        except importlib.metadata.PackageNotFoundError:
-            versions[package_name] = "not-installed"
-    return versions
+def _dependency_versions(names: Sequence[str], *, cached: bool) -> dict[str, str]:
+    lookup = _cached_dependency_version if cached else _dependency_version
+    return {package_name: lookup(package_name) for package_name in names}
+
+
+def _dependency_version(package_name: str) -> str:
+    try:
+        return importlib.metadata.version(package_name)
+    except importlib.metadata.PackageNotFoundError:
+        return "not-installed"
+
+
+# Each lookup scans the dist-info directories on sys.path; installs rarely change
+# within a process.
+_cached_dependency_version = lru_cache(maxsize=None)(_dependency_version)
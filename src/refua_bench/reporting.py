@@ -1,29 +1,42 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from refua_bench import _json
+
 
 def read_json(path: str | Path) -> dict[str, Any]:
-    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    payload = _json.loads(Path(path).read_bytes())
     if not isinstance(payload, dict):
         raise ValueError(f"JSON payload at {path} must be an object")
     return payload
 
 
+def encode_json(payload: dict[str, Any]) -> bytes:
+    return _json.dumps(payload, indent=True, sort_keys=True, newline=True)
+
+
 def write_json(path: str | Path, payload: dict[str, Any]) -> None:
-    out_path = Path(path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
+    _write_output(path, encode_json(payload))
 
 
 def write_markdown(path: str | Path, text: str) -> None:
-    out_path = Path(path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(text.strip() + "\n", encoding="utf-8")
+    _write_output(path, (text.strip() + "\n").encode("utf-8"))
+
+
+def _write_output(path: str | Path, data: bytes) -> None:
+    # Callers encode before the open, so a payload that fails to encode leaves an
+    # existing report untouched instead of truncated. The output directory usually
+    # exists already, so it is only created when the open fails instead of paying
+    # a mkdir call on every write.
+    try:
+        handle = open(path, "wb")
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path, "wb")
+    with handle:
+        handle.write(data)
 
 
 def render_run_markdown(run_payload: dict[str, Any]) -> str:
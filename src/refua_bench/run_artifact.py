@@ -2,48 +2,68 @@ from __future__ import annotations
 
 import math
 from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
+from refua_bench import _cache, _json
 from refua_bench.metrics import metric_direction
 from refua_bench.schema import BenchmarkSuite
 
-_TOP_LEVEL_KEYS = {
+_TOP_LEVEL_KEYS = frozenset(
+    {
+        "run_id",
+        "suite_name",
+        "suite_version",
+        "adapter",
+        "started_at",
+        "finished_at",
+        "summary",
+        "task_results",
+        "provenance",
+    }
+)
+
+_TOP_LEVEL_STR_KEYS = (
     "run_id",
     "suite_name",
     "suite_version",
     "adapter",
     "started_at",
     "finished_at",
-    "summary",
-    "task_results",
-    "provenance",
-}
-
-_SUMMARY_KEYS = {
-    "tasks_total",
-    "tasks_with_errors",
-    "cases_total",
-    "case_failures",
-    "all_cases_succeeded",
-}
-
-_TASK_KEYS = {
-    "task_id",
-    "metric",
-    "direction",
-    "score",
-    "cases_total",
-    "case_failures",
-    "case_results",
-}
-
-_CASE_KEYS = {
-    "case_id",
-    "expected",
-    "predicted",
-    "duration_ms",
-    "error",
-}
+)
+
+_SUMMARY_KEYS = frozenset(
+    {
+        "tasks_total",
+        "tasks_with_errors",
+        "cases_total",
+        "case_failures",
+        "all_cases_succeeded",
+    }
+)
+
+_TASK_KEYS = frozenset(
+    {
+        "task_id",
+        "metric",
+        "direction",
+        "score",
+        "cases_total",
+        "case_failures",
+        "case_results",
+    }
+)
+
+_CASE_KEYS = frozenset(
+    {
+        "case_id",
+        "expected",
+        "predicted",
+        "duration_ms",
+        "error",
+    }
+)
 
 
 def validate_run_artifact(
@@ -52,49 +72,58 @@ def validate_run_artifact(
     source: str,
     suite: BenchmarkSuite | None = None,
 ) -> dict[str, Any]:
-    run = _require_mapping(payload, f"{source}")
+    run = _require_mapping(payload, source)
     _validate_key_set(run, required=_TOP_LEVEL_KEYS, path=source)
 
-    _require_non_empty_str(run.get("run_id"), f"{source}.run_id")
-    suite_name = _require_non_empty_str(run.get("suite_name"), f"{source}.suite_name")
-    suite_version = _require_non_empty_str(
-        run.get("suite_version"), f"{source}.suite_version"
-    )
-    _require_non_empty_str(run.get("adapter"), f"{source}.adapter")
-    _require_non_empty_str(run.get("started_at"), f"{source}.started_at")
-    _require_non_empty_str(run.get("finished_at"), f"{source}.finished_at")
+    # The key set is already checked, so the string fields are read directly and
+    # checked in one pass; the helper only runs to report a bad value.
+    for key in _TOP_LEVEL_STR_KEYS:
+        value = run[key]
+        if type(value) is not str or not value.strip():
+            _require_non_empty_str(value, source, key)
+    suite_name = run["suite_name"].strip()
+    suite_version = run["suite_version"].strip()
 
-    summary = _require_mapping(run.get("summary"), f"{source}.summary")
-    _validate_key_set(summary, required=_SUMMARY_KEYS, path=f"{source}.summary")
+    summary = _require_mapping(run.get("summary"), source, "summary")
+    summary_path = f"{source}.summary"
+    _validate_key_set(summary, required=_SUMMARY_KEYS, path=summary_path)
 
     summary_tasks_total = _require_non_negative_int(
         summary.get("tasks_total"),
-        f"{source}.summary.tasks_total",
+        summary_path,
+        "tasks_total",
     )
     summary_tasks_with_errors = _require_non_negative_int(
         summary.get("tasks_with_errors"),
-        f"{source}.summary.tasks_with_errors",
+        summary_path,
+        "tasks_with_errors",
     )
     summary_cases_total = _require_non_negative_int(
         summary.get("cases_total"),
-        f"{source}.summary.cases_total",
+        summary_path,
+        "cases_total",
     )
     summary_case_failures = _require_non_negative_int(
         summary.get("case_failures"),
-        f"{source}.summary.case_failures",
+        summary_path,
+        "case_failures",
     )
     summary_all_cases_succeeded = _require_bool(
         summary.get("all_cases_succeeded"),
-        f"{source}.summary.all_cases_succeeded",
+        summary_path,
+        "all_cases_succeeded",
     )
 
-    task_results_raw = _require_list(run.get("task_results"), f"{source}.task_results")
-    provenance = _require_mapping(run.get("provenance"), f"{source}.provenance")
+    task_results_raw = _require_list(run.get("task_results"), source, "task_results")
+    provenance = _require_mapping(run.get("provenance"), source, "provenance")
 
     task_ids: set[str] = set()
     case_totals_sum = 0
     case_failures_sum = 0
     tasks_with_errors = 0
+    # The id -> task map is only needed for suite alignment, so it stays empty
+    # when no suite is given.
+    align_suite = suite is not None
     task_map: dict[str, dict[str, Any]] = {}
 
     for index, task_item in enumerate(task_results_raw):
@@ -102,32 +131,30 @@ def validate_run_artifact(
         task = _require_mapping(task_item, task_path)
         _validate_key_set(task, required=_TASK_KEYS, path=task_path)
 
-        task_id = _require_non_empty_str(task.get("task_id"), f"{task_path}.task_id")
+        task_id = _require_non_empty_str(task.get("task_id"), task_path, "task_id")
         if task_id in task_ids:
             raise ValueError(f"Duplicate task_id in {source}: '{task_id}'")
         task_ids.add(task_id)
-        task_map[task_id] = task
+        if align_suite:
+            task_map[task_id] = task
 
-        _require_non_empty_str(task.get("metric"), f"{task_path}.metric")
-        direction = _require_non_empty_str(
-            task.get("direction"), f"{task_path}.direction"
-        )
+        _require_non_empty_str(task.get("metric"), task_path, "metric")
+        direction = _require_non_empty_str(task.get("direction"), task_path, "direction")
         if direction not in {"higher", "lower"}:
             raise ValueError(f"{task_path}.direction must be 'higher' or 'lower'")
 
-        _require_optional_finite_number(task.get("score"), f"{task_path}.score")
+        _require_optional_finite_number(task.get("score"), task_path, "score")
         cases_total = _require_non_negative_int(
-            task.get("cases_total"), f"{task_path}.cases_total"
+            task.get("cases_total"), task_path, "cases_total"
         )
         case_failures = _require_non_negative_int(
-            task.get("case_failures"),
-            f"{task_path}.case_failures",
+            task.get("case_failures"), task_path, "case_failures"
         )
         if case_failures > cases_total:
             raise ValueError(f"{task_path}.case_failures cannot exceed cases_total")
 
         case_results_raw = _require_list(
-            task.get("case_results"), f"{task_path}.case_results"
+            task.get("case_results"), task_path, "case_results"
         )
         if len(case_results_raw) != cases_total:
             raise ValueError(
@@ -135,31 +162,9 @@ def validate_run_artifact(
                 f"len(case_results)={len(case_results_raw)}"
             )
 
-        case_ids: set[str] = set()
-        observed_case_failures = 0
-        for case_index, case_item in enumerate(case_results_raw):
-            case_path = f"{task_path}.case_results[{case_index}]"
-            case = _require_mapping(case_item, case_path)
-            _validate_key_set(case, required=_CASE_KEYS, path=case_path)
-
-            case_id = _require_non_empty_str(
-                case.get("case_id"), f"{case_path}.case_id"
-            )
-            if case_id in case_ids:
-                raise ValueError(f"Duplicate case_id in {task_path}: '{case_id}'")
-            case_ids.add(case_id)
-
-            _require_non_negative_finite_number(
-                case.get("duration_ms"), f"{case_path}.duration_ms"
-            )
-
-            error = case.get("error")
-            if error is None:
-                pass
-            elif isinstance(error, str):
-                observed_case_failures += 1
-            else:
-                raise ValueError(f"{case_path}.error must be a string or null")
+        observed_case_failures = _count_case_failures_bulk(case_results_raw)
+        if observed_case_failures is None:
+            observed_case_failures = _validate_case_results(case_results_raw, task_path)
 
         if observed_case_failures != case_failures:
             raise ValueError(
@@ -226,6 +231,88 @@ def validate_run_artifact(
     }
 
 
+def load_and_validate_run_artifact(
+    path: str | Path,
+    *,
+    source: str,
+    suite: BenchmarkSuite | None = None,
+) -> dict[str, Any]:
+    """Decode a run artifact file and validate it in one step.
+
+    The decoded payload goes straight into ``validate_run_artifact``, whose own
+    object check replaces the separate one ``read_json`` would do. With
+    ``REFUA_BENCH_CACHE=1`` the decode is reused until the file changes; task and
+    case entries are then shared between callers and must not be mutated.
+    """
+    if _cache.enabled():
+        payload = _load_run_payload_cached(*_cache.file_key(path))
+    else:
+        payload = _json.loads(Path(path).read_bytes())
+    return validate_run_artifact(payload, source=source, suite=suite)
+
+
+@lru_cache(maxsize=32)
+def _load_run_payload_cached(path: str, mtime_ns: int, size: int) -> Any:
+    # As with cached suites and registries, mtime and size only key the cache.
+    return _json.loads(Path(path).read_bytes())
+
+
+def _count_case_failures_bulk(case_results: list[Any]) -> int | None:
+    # Checks the whole case list column by column, which is much cheaper than the
+    # per-case walk for large, well-formed runs. Returns None as soon as anything
+    # looks off so _validate_case_results can report the exact problem.
+    if not all(type(case) is dict and case.keys() == _CASE_KEYS for case in case_results):
+        return None
+
+    case_ids = [case["case_id"] for case in case_results]
+    if not all(type(case_id) is str for case_id in case_ids):
+        return None
+    unique_ids = {case_id.strip() for case_id in case_ids}
+    if len(unique_ids) != len(case_ids) or "" in unique_ids:
+        return None
+
+    for duration in [case["duration_ms"] for case in case_results]:
+        duration_type = type(duration)
+        if duration_type is not float and duration_type is not int:
+            return None
+        if not 0 <= duration < math.inf:
+            return None
+
+    failures = 0
+    for error in [case["error"] for case in case_results]:
+        if error is None:
+            continue
+        if type(error) is not str:
+            return None
+        failures += 1
+    return failures
+
+
+def _validate_case_results(case_results: list[Any], task_path: str) -> int:
+    case_ids: set[str] = set()
+    observed_case_failures = 0
+    for case_index, case_item in enumerate(case_results):
+        case_path = f"{task_path}.case_results[{case_index}]"
+        case = _require_mapping(case_item, case_path)
+        _validate_key_set(case, required=_CASE_KEYS, path=case_path)
+
+        case_id = _require_non_empty_str(case.get("case_id"), case_path, "case_id")
+        if case_id in case_ids:
+            raise ValueError(f"Duplicate case_id in {task_path}: '{case_id}'")
+        case_ids.add(case_id)
+
+        _require_non_negative_finite_number(
+            case.get("duration_ms"), case_path, "duration_ms"
+        )
+
+        error = case.get("error")
+        if error is not None:
+            if not isinstance(error, str):
+                raise ValueError(f"{case_path}.error must be a string or null")
+            observed_case_failures += 1
+    return observed_case_failures
+
+
 def _validate_suite_alignment(
     *,
     suite: BenchmarkSuite,
@@ -244,9 +331,10 @@ def _validate_suite_alignment(
             f"does not match suite.version='{suite.version}'"
         )
 
-    expected_task_ids = {task.task_id for task in suite.tasks}
-    run_task_ids = set(task_map.keys())
-    if run_task_ids != expected_task_ids:
+    case_id_index = suite.case_id_index()
+    if task_map.keys() != case_id_index.keys():
+        expected_task_ids = set(case_id_index)
+        run_task_ids = set(task_map)
         missing = sorted(expected_task_ids - run_task_ids)
         extra = sorted(run_task_ids - expected_task_ids)
         raise ValueError(
@@ -254,22 +342,18 @@ def _validate_suite_alignment(
             f"(missing={missing}, extra={extra})"
         )
 
+    # Only called on artifacts that passed validate_run_artifact, so every task
+    # and case entry is already known to be well-formed and is read directly.
     for task in suite.tasks:
         run_task = task_map[task.task_id]
-        run_metric = _require_non_empty_str(
-            run_task.get("metric"),
-            f"{source}.task_results[{task.task_id}].metric",
-        )
+        run_metric = run_task["metric"].strip()
         if run_metric != task.metric:
             raise ValueError(
                 f"{source} task '{task.task_id}' metric '{run_metric}' does not match "
                 f"suite metric '{task.metric}'"
             )
 
-        run_direction = _require_non_empty_str(
-            run_task.get("direction"),
-            f"{source}.task_results[{task.task_id}].direction",
-        )
+        run_direction = run_task["direction"].strip()
         expected_direction = metric_direction(task.metric)
         if run_direction != expected_direction:
             raise ValueError(
@@ -277,23 +361,8 @@ def _validate_suite_alignment(
                 f"expected '{expected_direction}'"
             )
 
-        run_case_results = _require_list(
-            run_task.get("case_results"),
-            f"{source}.task_results[{task.task_id}].case_results",
-        )
-        expected_case_ids = {case.case_id for case in task.cases}
-        run_case_ids = set()
-        for index, case_item in enumerate(run_case_results):
-            case = _require_mapping(
-                case_item,
-                f"{source}.task_results[{task.task_id}].case_results[{index}]",
-            )
-            run_case_ids.add(
-                _require_non_empty_str(
-                    case.get("case_id"),
-                    f"{source}.task_results[{task.task_id}].case_results[{index}].case_id",
-                )
-            )
+        expected_case_ids = case_id_index[task.task_id]
+        run_case_ids = {case["case_id"].strip() for case in run_task["case_results"]}
 
         if run_case_ids != expected_case_ids:
             missing_cases = sorted(expected_case_ids - run_case_ids)
@@ -303,10 +372,7 @@ def _validate_suite_alignment(
                 f"(missing={missing_cases}, extra={extra_cases})"
             )
 
-        run_cases_total = _require_non_negative_int(
-            run_task.get("cases_total"),
-            f"{source}.task_results[{task.task_id}].cases_total",
-        )
+        run_cases_total = run_task["cases_total"]
         if run_cases_total != len(task.cases):
             raise ValueError(
                 f"{source} task '{task.task_id}' cases_total={run_cases_total} does not match "
@@ -317,68 +383,92 @@ def _validate_suite_alignment(
 def _validate_key_set(
     payload: Mapping[str, Any],
     *,
-    required: set[str],
+    required: frozenset[str],
     path: str,
 ) -> None:
-    keys = set(payload.keys())
-    missing = sorted(required - keys)
-    extra = sorted(keys - required)
-    if missing or extra:
-        raise ValueError(f"{path} has invalid keys (missing={missing}, extra={extra})")
-
-
-def _require_mapping(value: Any, path: str) -> dict[str, Any]:
+    # Compare against the keys view directly; the sets and sorts are only needed
+    # to report a mismatch.
+    keys = payload.keys()
+    if keys == required:
+        return
+    missing = sorted(required.difference(keys))
+    extra = sorted(set(keys).difference(required))
+    raise ValueError(f"{path} has invalid keys (missing={missing}, extra={extra})")
+
+
+def _join_path(path: str, field: str | None) -> str:
+    return path if field is None else f"{path}.{field}"
+
+
+# The helpers take the parent path and field name separately and only join them
+# when raising, so well-formed artifacts never format a path string. They validate
+# without copying: dicts and lists are returned as-is, and only other Mapping types
+# (e.g. MappingProxyType) are converted to a dict.
+def _require_mapping(value: Any, path: str, field: str | None = None) -> dict[str, Any]:
+    if isinstance(value, dict):
+        return value
     if not isinstance(value, Mapping):
-        raise ValueError(f"{path} must be an object")
+        raise ValueError(f"{_join_path(path, field)} must be an object")
     return dict(value)
 
 
-def _require_list(value: Any, path: str) -> list[Any]:
+def _require_list(value: Any, path: str, field: str | None = None) -> list[Any]:
     if not isinstance(value, list):
-        raise ValueError(f"{path} must be a list")
-    return list(value)
+        raise ValueError(f"{_join_path(path, field)} must be a list")
+    return value
 
 
-def _require_non_empty_str(value: Any, path: str) -> str:
+def _require_non_empty_str(value: Any, path: str, field: str | None = None) -> str:
     if not isinstance(value, str):
-        raise ValueError(f"{path} must be a string")
+        raise ValueError(f"{_join_path(path, field)} must be a string")
     normalized = value.strip()
     if not normalized:
-        raise ValueError(f"{path} must be a non-empty string")
+        raise ValueError(f"{_join_path(path, field)} must be a non-empty string")
     return normalized
 
 
-def _require_non_negative_int(value: Any, path: str) -> int:
-    if not isinstance(value, int) or isinstance(value, bool):
-        raise ValueError(f"{path} must be a non-negative integer")
-    if value < 0:
-        raise ValueError(f"{path} must be a non-negative integer")
+def _require_non_negative_int(value: Any, path: str, field: str | None = None) -> int:
+    if type(value) is int and value >= 0:
+        return value
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise ValueError(f"{_join_path(path, field)} must be a non-negative integer")
     return value
 
 
-def _require_bool(value: Any, path: str) -> bool:
-    if not isinstance(value, bool):
-        raise ValueError(f"{path} must be a boolean")
+def _require_bool(value: Any, path: str, field: str | None = None) -> bool:
+    # bool cannot be subclassed, so identity against the two singletons is exact.
+    if value is not True and value is not False:
+        raise ValueError(f"{_join_path(path, field)} must be a boolean")
     return value
 
 
-def _require_non_negative_finite_number(value: Any, path: str) -> float:
-    numeric = _require_finite_number(value, path)
+def _require_non_negative_finite_number(
+    value: Any, path: str, field: str | None = None
+) -> float:
+    numeric = _require_finite_number(value, path, field)
     if numeric < 0:
-        raise ValueError(f"{path} must be >= 0")
+        raise ValueError(f"{_join_path(path, field)} must be >= 0")
     return numeric
 
 
-def _require_optional_finite_number(value: Any, path: str) -> float | None:
+def _require_optional_finite_number(
+    value: Any, path: str, field: str | None = None
+) -> float | None:
     if value is None:
         return None
-    return _require_finite_number(value, path)
+    return _require_finite_number(value, path, field)
 
 
-def _require_finite_number(value: Any, path: str) -> float:
+def _require_finite_number(value: Any, path: str, field: str | None = None) -> float:
+    value_type = type(value)
+    if value_type is float:
+        if math.isfinite(value):
+            return value
+    elif value_type is int:
+        return float(value)
     if not isinstance(value, (int, float)) or isinstance(value, bool):
-        raise ValueError(f"{path} must be a finite number")
+        raise ValueError(f"{_join_path(path, field)} must be a finite number")
     numeric = float(value)
     if not math.isfinite(numeric):
-        raise ValueError(f"{path} must be a finite number")
+        raise ValueError(f"{_join_path(path, field)} must be a finite number")
     return numeric
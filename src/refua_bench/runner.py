@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import copy
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from time import perf_counter
+from time import perf_counter_ns
 from typing import Any
 from uuid import uuid4
 
-from refua_bench.adapters import ModelAdapter
+from refua_bench.adapters import BatchResult, GoldenAdapter, ModelAdapter, predict_many
 from refua_bench.metrics import compute_metric, metric_direction
 from refua_bench.schema import BenchmarkSuite, BenchmarkTask
 
@@ -19,6 +21,15 @@ class CaseResult:
     duration_ms: float
     error: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "case_id": self.case_id,
+            "expected": _detach(self.expected),
+            "predicted": _detach(self.predicted),
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
 
 @dataclass(slots=True)
 class TaskResult:
@@ -30,6 +41,17 @@ class TaskResult:
     case_failures: int
     case_results: list[CaseResult]
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "metric": self.metric,
+            "direction": self.direction,
+            "score": self.score,
+            "cases_total": self.cases_total,
+            "case_failures": self.case_failures,
+            "case_results": [case.to_dict() for case in self.case_results],
+        }
+
 
 @dataclass(slots=True)
 class BenchmarkRun:
@@ -44,7 +66,19 @@ class BenchmarkRun:
     provenance: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Same result as dataclasses.asdict(): nested values are copied, so the
+        # dict shares no mutable state with the run.
+        return {
+            "run_id": self.run_id,
+            "suite_name": self.suite_name,
+            "suite_version": self.suite_version,
+            "adapter": self.adapter,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "summary": _detach(self.summary),
+            "task_results": [task.to_dict() for task in self.task_results],
+            "provenance": _detach(self.provenance),
+        }
 
 
 def run_benchmark(
@@ -52,17 +86,29 @@ def run_benchmark(
     adapter: ModelAdapter,
     *,
     provenance: dict[str, Any] | None = None,
+    parallelism: int = 1,
 ) -> BenchmarkRun:
+    """Run every task of ``suite`` through ``adapter``.
+
+    With ``parallelism`` > 1, tasks run on that many threads if the adapter sets
+    ``thread_safe = True``; other adapters always run tasks one at a time. Task
+    results keep the suite's order either way.
+    """
     started_at = datetime.now(UTC)
-    task_results: list[TaskResult] = []
+
+    if parallelism > 1 and len(suite.tasks) > 1 and getattr(adapter, "thread_safe", False):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(parallelism, len(suite.tasks))) as executor:
+            task_results = list(executor.map(lambda task: _run_task(task, adapter), suite.tasks))
+    else:
+        task_results = [_run_task(task, adapter) for task in suite.tasks]
 
     cases_total = 0
     case_failures = 0
     tasks_with_errors = 0
 
-    for task in suite.tasks:
-        result = _run_task(task, adapter)
-        task_results.append(result)
+    for result in task_results:
         cases_total += result.cases_total
         case_failures += result.case_failures
         if result.case_failures > 0 or result.score is None:
@@ -90,21 +136,155 @@ def run_benchmark(
     )
 
 
+def synthesize_golden_artifact(
+    suite: BenchmarkSuite,
+    *,
+    provenance: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build the artifact ``run_benchmark(suite, GoldenAdapter()).to_dict()`` returns.
+
+    The golden predictions are the expected values, so the dict is assembled
+    directly from the suite without going through the runner. Case timings are
+    reported as zero.
+    """
+    timestamp = datetime.now(UTC).isoformat()
+    task_results: list[dict[str, Any]] = []
+    case_failures = 0
+    tasks_with_errors = 0
+
+    for task in suite.tasks:
+        prediction_key = task.prediction_key
+        expected_key = task.expected_key
+        expected_values: list[Any] = []
+        predicted_values: list[Any] = []
+        case_results: list[dict[str, Any]] = []
+        task_failures = 0
+
+        for case in task.cases:
+            expected = _detach(case.expected.get(expected_key))
+            predicted: Any = None
+            error: str | None = None
+            if prediction_key in case.expected:
+                predicted = _detach(case.expected[prediction_key])
+                expected_values.append(expected)
+                predicted_values.append(predicted)
+            else:
+                # Same message the runner records for a missing prediction key.
+                error = str(
+                    KeyError(
+                        "Missing prediction key "
+                        f"'{prediction_key}' in adapter output for case '{case.case_id}'"
+                    )
+                )
+                task_failures += 1
+            case_results.append(
+                {
+                    "case_id": case.case_id,
+                    "expected": expected,
+                    "predicted": predicted,
+                    "duration_ms": 0.0,
+                    "error": error,
+                }
+            )
+
+        score: float | None = None
+        if expected_values:
+            score = compute_metric(
+                task.metric,
+                expected_values,
+                predicted_values,
+                positive_label=task.positive_label,
+                enrichment_fraction=task.enrichment_fraction,
+                bedroc_alpha=task.bedroc_alpha,
+            )
+        case_failures += task_failures
+        if task_failures > 0 or score is None:
+            tasks_with_errors += 1
+        task_results.append(
+            {
+                "task_id": task.task_id,
+                "metric": task.metric,
+                "direction": metric_direction(task.metric),
+                "score": score,
+                "cases_total": len(task.cases),
+                "case_failures": task_failures,
+                "case_results": case_results,
+            }
+        )
+
+    return {
+        "run_id": uuid4().hex,
+        "suite_name": suite.name,
+        "suite_version": suite.version,
+        "adapter": GoldenAdapter.name,
+        "started_at": timestamp,
+        "finished_at": timestamp,
+        "summary": {
+            "tasks_total": len(suite.tasks),
+            "tasks_with_errors": tasks_with_errors,
+            "cases_total": sum(len(task.cases) for task in suite.tasks),
+            "case_failures": case_failures,
+            "all_cases_succeeded": case_failures == 0,
+        },
+        "task_results": task_results,
+        "provenance": {} if provenance is None else copy.deepcopy(provenance),
+    }
+
+
+def _detach(value: Any) -> Any:
+    # Matches the deep copy asdict() makes of nested values; scalars need no copy.
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    return copy.deepcopy(value)
+
+
 def _run_task(task: BenchmarkTask, adapter: ModelAdapter) -> TaskResult:
     expected_values: list[Any] = []
     predicted_values: list[Any] = []
 
     case_results: list[CaseResult] = []
     case_failures = 0
+    # The golden adapter just echoes expected values; read them in place instead
+    # of dispatching through predict() for every case. Subclasses may override
+    # predict, so only the exact type takes the shortcut.
+    golden = type(adapter) is GoldenAdapter
+
+    # Adapters that serve whole batches get every case of the task in one
+    # predict_many call; each case is then charged an equal share of its time.
+    # Adapters whose predict_many only loops over predict say so with
+    # batching = False and keep per-case calls and timings.
+    batch_outputs: list[BatchResult] | None = None
+    batch_duration_ms = 0.0
+    if (
+        not golden
+        and task.cases
+        and callable(getattr(adapter, "predict_many", None))
+        and getattr(adapter, "batching", True)
+    ):
+        start = perf_counter_ns()
+        try:
+            batch_outputs = predict_many(adapter, task, task.cases)
+        except Exception as exc:  # noqa: BLE001
+            batch_outputs = [exc] * len(task.cases)
+        batch_duration_ms = (perf_counter_ns() - start) / 1_000_000.0 / len(task.cases)
 
-    for case in task.cases:
+    for index, case in enumerate(task.cases):
         expected = case.expected.get(task.expected_key)
         predicted: Any = None
         error: str | None = None
-        start = perf_counter()
+        start = perf_counter_ns()
 
         try:
-            output = adapter.predict(task, case)
+            output: Mapping[str, Any]
+            if golden:
+                output = case.expected
+            elif batch_outputs is None:
+                output = adapter.predict(task, case)
+            else:
+                batch_output = batch_outputs[index]
+                if isinstance(batch_output, Exception):
+                    raise batch_output
+                output = batch_output
             if task.prediction_key not in output:
                 raise KeyError(
                     "Missing prediction key "
@@ -117,7 +297,10 @@ def _run_task(task: BenchmarkTask, adapter: ModelAdapter) -> TaskResult:
             error = str(exc)
             case_failures += 1
 
-        duration_ms = (perf_counter() - start) * 1000.0
+        if batch_outputs is None:
+            duration_ms = (perf_counter_ns() - start) / 1_000_000.0
+        else:
+            duration_ms = batch_duration_ms
         case_results.append(
             CaseResult(
                 case_id=case.case_id,
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-import json
+import sys
 from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, overload
 
 import yaml
 
+from refua_bench import _cache, _json
+
+# libyaml-backed loader/dumper when PyYAML was built with it, pure Python otherwise.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 SUPPORTED_METRICS = {
     "mae",
     "rmse",
@@ -49,34 +56,77 @@ class BenchmarkSuite:
     description: str
     tasks: list[BenchmarkTask]
     metadata: dict[str, Any] = field(default_factory=dict)
+    _case_id_index: dict[str, frozenset[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def case_id_index(self) -> dict[str, frozenset[str]]:
+        """Map each task id to its case ids, built on first use and then reused.
+
+        Validating many runs against one suite reads this instead of rebuilding
+        the sets every time, so the suite's tasks must not change afterwards.
+        """
+        if self._case_id_index is None:
+            self._case_id_index = {
+                task.task_id: frozenset(case.case_id for case in task.cases)
+                for task in self.tasks
+            }
+        return self._case_id_index
 
 
 def load_data_file(path: str | Path) -> dict[str, Any]:
     file_path = Path(path)
-    raw = file_path.read_text(encoding="utf-8")
     if file_path.suffix.lower() == ".json":
-        data = json.loads(raw)
+        data = _json.loads(file_path.read_bytes())
     else:
-        parsed = yaml.safe_load(raw)
+        # The loader decodes UTF-8 bytes itself, so no intermediate str is built.
+        parsed = yaml.load(file_path.read_bytes(), Loader=_YAML_LOADER)
         data = {} if parsed is None else parsed
     if not isinstance(data, dict):
         raise ValueError(f"Top-level data in {file_path} must be an object/mapping")
     return data
 
 
+@overload
+def dump_yaml(payload: Any) -> str: ...
+@overload
+def dump_yaml(payload: Any, stream: IO[bytes]) -> None: ...
+def dump_yaml(payload: Any, stream: IO[bytes] | None = None) -> str | None:
+    # With a binary stream the dumper encodes and writes through its own buffer,
+    # so no intermediate str is built.
+    if stream is None:
+        return yaml.dump(payload, Dumper=_YAML_DUMPER, sort_keys=False)
+    yaml.dump(payload, stream, Dumper=_YAML_DUMPER, sort_keys=False, encoding="utf-8")
+    return None
+
+
 def dump_json(path: str | Path, payload: dict[str, Any]) -> None:
-    out_path = Path(path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
+    # Same as reporting.write_json: orjson when the "fast" extra is installed, the
+    # stdlib otherwise, encoded before the open so a failure leaves the file as is.
+    data = _json.dumps(payload, indent=True, sort_keys=True, newline=True)
+    try:
+        handle = open(path, "wb")
+    except FileNotFoundError:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path, "wb")
+    with handle:
+        handle.write(data)
 
 
 def load_suite(path: str | Path) -> BenchmarkSuite:
+    if _cache.enabled():
+        return _load_suite_cached(*_cache.file_key(path))
     payload = load_data_file(path)
     return suite_from_mapping(payload)
 
 
+@lru_cache(maxsize=32)
+def _load_suite_cached(path: str, mtime_ns: int, size: int) -> BenchmarkSuite:
+    # mtime and size only key the cache. The suite is shared between callers,
+    # which only read it.
+    return suite_from_mapping(load_data_file(path))
+
+
 def suite_from_mapping(data: Mapping[str, Any]) -> BenchmarkSuite:
     name = _required_str(data, "name")
     version = str(data.get("version", "0.0.1"))
@@ -110,7 +160,9 @@ def _parse_task(item: Any) -> BenchmarkTask:
     if not isinstance(item, Mapping):
         raise ValueError("Each task must be a mapping")
 
-    task_id = _required_str(item, "id")
+    # Ids and keys are interned so lookups against adapter-side copies (which
+    # intern the same strings) can match by identity.
+    task_id = sys.intern(_required_str(item, "id"))
     metric = _required_str(item, "metric")
     if metric not in SUPPORTED_METRICS:
         allowed = ", ".join(sorted(SUPPORTED_METRICS))
@@ -118,8 +170,8 @@ def _parse_task(item: Any) -> BenchmarkTask:
             f"Unsupported metric '{metric}' for task '{task_id}'. Allowed: {allowed}"
         )
 
-    prediction_key = _required_str(item, "prediction_key")
-    expected_key = str(item.get("expected_key", prediction_key))
+    prediction_key = sys.intern(_required_str(item, "prediction_key"))
+    expected_key = sys.intern(str(item.get("expected_key", prediction_key)))
     regression_tolerance = _float(
         item.get("regression_tolerance", 0.0), "regression_tolerance"
     )
@@ -170,7 +222,7 @@ def _parse_case(item: Any, task_id: str) -> BenchmarkCase:
     if not isinstance(item, Mapping):
         raise ValueError(f"Cases in task '{task_id}' must be mappings")
 
-    case_id = _required_str(item, "id")
+    case_id = sys.intern(_required_str(item, "id"))
 
     input_data = item.get("input", {})
     if not isinstance(input_data, Mapping):
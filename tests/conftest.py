@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 
+from refua_bench.adapters import GoldenAdapter
+from refua_bench.runner import run_benchmark
 from refua_bench.schema import BenchmarkSuite, suite_from_mapping
 
 
-@pytest.fixture
-def suite_payload() -> dict[str, object]:
+def _suite_payload() -> dict[str, object]:
     return {
         "name": "test-suite",
         "version": "1.0.0",
@@ -52,6 +55,18 @@ def suite_payload() -> dict[str, object]:
     }
 
 
+@pytest.fixture
+def suite_payload() -> dict[str, object]:
+    return _suite_payload()
+
+
 @pytest.fixture
 def suite(suite_payload: dict[str, object]) -> BenchmarkSuite:
     return suite_from_mapping(suite_payload)
+
+
+@pytest.fixture(scope="session")
+def golden_run() -> dict[str, Any]:
+    # One golden-adapter run of the suite above shared by the whole session; tests
+    # read it as a baseline and must copy it before mutating.
+    return run_benchmark(suite_from_mapping(_suite_payload()), GoldenAdapter()).to_dict()
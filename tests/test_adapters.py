@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from refua_bench.adapters import CommandAdapter, FileAdapter, predict_many
+from refua_bench.schema import BenchmarkCase, BenchmarkSuite, BenchmarkTask
+
+_WORKER = """
+import json
+import os
+import sys
+import time
+
+for line in sys.stdin:
+    request = json.loads(line)
+    time.sleep(request["input"].get("sleep", 0))
+    print(json.dumps({"case_id": request["case_id"], "pid": os.getpid()}), flush=True)
+"""
+
+
+_BATCH_WORKER = """
+import json
+import sys
+
+request = json.loads(sys.stdin.read())
+results = []
+for item in request["batch"]:
+    if item["case_id"] == "b":
+        results.append("no prediction for b")
+        if request.get("stop_on_error"):
+            break
+    else:
+        results.append({"affinity": -1.0, "case_id": item["case_id"]})
+print(json.dumps({"results": results}))
+"""
+
+
+def _persistent_adapter(tmp_path: Path, timeout_seconds: float = 10.0) -> CommandAdapter:
+    script = tmp_path / "worker.py"
+    script.write_text(_WORKER, encoding="utf-8")
+    return CommandAdapter(
+        {
+            "command": [sys.executable, str(script)],
+            "persistent": True,
+            "timeout_seconds": timeout_seconds,
+        }
+    )
+
+
+def _batch_adapter(tmp_path: Path, *, stop_on_error: bool) -> CommandAdapter:
+    script = tmp_path / "batch_worker.py"
+    script.write_text(_BATCH_WORKER, encoding="utf-8")
+    return CommandAdapter(
+        {
+            "command": [sys.executable, str(script)],
+            "batch": True,
+            "batch_stop_on_error": stop_on_error,
+        }
+    )
+
+
+def test_command_adapter_persistent_reuses_worker(
+    tmp_path: Path, suite: BenchmarkSuite
+) -> None:
+    task = suite.tasks[0]
+    with _persistent_adapter(tmp_path) as adapter:
+        first = adapter.predict(task, task.cases[0])
+        second = adapter.predict(task, task.cases[1])
+
+    assert first["case_id"] == "a"
+    assert second["case_id"] == "b"
+    assert first["pid"] == second["pid"]
+
+
+def test_command_adapter_persistent_respawns_after_timeout(
+    tmp_path: Path, suite: BenchmarkSuite
+) -> None:
+    task = suite.tasks[0]
+    slow_case = BenchmarkCase(case_id="slow", input={"sleep": 5}, expected={})
+    with _persistent_adapter(tmp_path, timeout_seconds=0.5) as adapter:
+        first = adapter.predict(task, task.cases[0])
+        with pytest.raises(subprocess.TimeoutExpired):
+            adapter.predict(task, slow_case)
+        after = adapter.predict(task, task.cases[1])
+
+    assert after["case_id"] == "b"
+    assert after["pid"] != first["pid"]
+
+
+
+class _LateTimer:
+    # Fires in cancel(), i.e. after the worker has already answered.
+    def __init__(self, interval: float, function: Callable[[], None]) -> None:
+        self._function = function
+
+    def start(self) -> None:
+        pass
+
+    def cancel(self) -> None:
+        self._function()
+
+
+def test_command_adapter_persistent_keeps_response_when_watchdog_fires_late(
+    tmp_path: Path, suite: BenchmarkSuite, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    task = suite.tasks[0]
+    with _persistent_adapter(tmp_path) as adapter:
+        with monkeypatch.context() as patch:
+            patch.setattr(threading, "Timer", _LateTimer)
+            first = adapter.predict(task, task.cases[0])
+        after = adapter.predict(task, task.cases[1])
+
+    assert first["case_id"] == "a"
+    assert after["case_id"] == "b"
+    assert after["pid"] != first["pid"]
+
+class _FlakyAdapter:
+    name = "flaky"
+
+    def predict(self, task: BenchmarkTask, case: BenchmarkCase) -> dict[str, float]:
+        if case.case_id == "a":
+            raise ValueError("boom")
+        return {task.prediction_key: 1.0}
+
+
+def test_command_adapter_encodes_same_request_as_payload(suite: BenchmarkSuite) -> None:
+    adapter = CommandAdapter({"command": ["true"], "include_expected": True})
+    task = suite.tasks[0]
+    for case in task.cases:
+        encoded = adapter._encode_request(task, case)
+        assert json.loads(encoded) == adapter._request(task, case)
+        assert list(json.loads(encoded)) == list(adapter._request(task, case))
+
+
+def test_predict_many_falls_back_to_predict(suite: BenchmarkSuite) -> None:
+    task = suite.tasks[0]
+
+    results = predict_many(_FlakyAdapter(), task, task.cases)
+    assert isinstance(results[0], ValueError)
+    assert results[1] == {"affinity": 1.0}
+
+    stopped = predict_many(_FlakyAdapter(), task, task.cases, stop_on_error=True)
+    assert isinstance(stopped[0], ValueError)
+    assert isinstance(stopped[1], RuntimeError)
+
+
+def test_command_adapter_batch_preserves_order_and_slot_errors(
+    tmp_path: Path, suite: BenchmarkSuite
+) -> None:
+    task = suite.tasks[0]
+    extra = BenchmarkCase(case_id="c", input={}, expected={})
+    cases = [task.cases[0], task.cases[1], extra]
+
+    results = predict_many(_batch_adapter(tmp_path, stop_on_error=False), task, cases)
+    assert isinstance(results[0], dict) and results[0]["case_id"] == "a"
+    assert isinstance(results[1], RuntimeError)
+    assert str(results[1]) == "no prediction for b"
+    assert isinstance(results[2], dict) and results[2]["case_id"] == "c"
+
+    stopped = predict_many(_batch_adapter(tmp_path, stop_on_error=True), task, cases)
+    assert isinstance(stopped[0], dict)
+    assert isinstance(stopped[1], RuntimeError)
+    assert isinstance(stopped[2], RuntimeError)
+    assert "Skipped case 'c'" in str(stopped[2])
+
+
+def test_file_adapter_streams_jsonl_predictions(tmp_path: Path, suite: BenchmarkSuite) -> None:
+    task = suite.tasks[0]
+    predictions_path = tmp_path / "predictions.jsonl"
+    rows = [
+        {"task_id": "affinity_mae", "case_id": "b", "prediction": -8.5},
+        {"task_id": "affinity_mae", "case_id": "a", "prediction": {"affinity": -9.5}},
+    ]
+    predictions_path.write_text(
+        "\n".join(json.dumps(row) for row in rows) + "\n\n", encoding="utf-8"
+    )
+
+    adapter = FileAdapter({"predictions_path": str(predictions_path)})
+    try:
+        assert adapter.predict(task, task.cases[0]) == {"affinity": -9.5}
+        assert adapter.predict(task, task.cases[1]) == {"affinity": -8.5}
+        with pytest.raises(KeyError, match="No predictions for task 'tox_acc'"):
+            adapter.predict(suite.tasks[1], suite.tasks[1].cases[0])
+    finally:
+        adapter.close()
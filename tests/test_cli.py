@@ -1,42 +1,70 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-
-import yaml
-
-from refua_bench.cli import main
+from typing import Any
+
+import pytest
+
+from refua_bench import _json
+from refua_bench.adapters import FileAdapter, GoldenAdapter, ModelAdapter
+from refua_bench.baseline_registry import load_registry, save_registry
+from refua_bench.cli import _load_optional_mapping, main
+from refua_bench.reporting import read_json, write_json
+from refua_bench.runner import run_benchmark
+from refua_bench.schema import dump_yaml, load_suite, suite_from_mapping
+
+_SUITE_PAYLOAD: dict[str, Any] = {
+    "name": "cli-suite",
+    "version": "1.0.0",
+    "tasks": [
+        {
+            "id": "affinity_mae",
+            "metric": "mae",
+            "prediction_key": "affinity",
+            "regression_tolerance": 0.05,
+            "cases": [
+                {"id": "a", "input": {"x": 1}, "expected": {"affinity": -9.0}},
+                {"id": "b", "input": {"x": 2}, "expected": {"affinity": -8.0}},
+            ],
+        }
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def shared_artifacts(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # The cli-suite YAML, its golden baseline and a regressed candidate (with the
+    # predictions and file-adapter config behind it) are only ever read, so the
+    # module's tests point at one copy instead of writing their own.
+    directory = tmp_path_factory.mktemp("cli-shared")
+    suite = suite_from_mapping(_SUITE_PAYLOAD)
+    predictions_path = directory / "predictions.json"
+    # Regresses affinity_mae by 1.0 on both cases.
+    predictions_path.write_bytes(
+        _json.dumps({"affinity_mae": {"a": {"affinity": -8.0}, "b": {"affinity": -7.0}}})
+    )
+    (directory / "config.yaml").write_text(
+        dump_yaml({"predictions_path": str(predictions_path)}), encoding="utf-8"
+    )
+    (directory / "suite.yaml").write_text(dump_yaml(_SUITE_PAYLOAD), encoding="utf-8")
+    write_json(directory / "baseline.json", run_benchmark(suite, GoldenAdapter()).to_dict())
+    candidate = run_benchmark(suite, FileAdapter({"predictions_path": str(predictions_path)}))
+    write_json(directory / "candidate.json", candidate.to_dict())
+    return directory
 
 
-def _write_suite(path: Path) -> None:
-    payload = {
-        "name": "cli-suite",
-        "version": "1.0.0",
-        "tasks": [
-            {
-                "id": "affinity_mae",
-                "metric": "mae",
-                "prediction_key": "affinity",
-                "regression_tolerance": 0.05,
-                "cases": [
-                    {"id": "a", "input": {"x": 1}, "expected": {"affinity": -9.0}},
-                    {"id": "b", "input": {"x": 2}, "expected": {"affinity": -8.0}},
-                ],
-            }
-        ],
-    }
-    path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+def _write_run(suite_path: Path, output_path: Path, adapter: ModelAdapter) -> None:
+    # Tests about compare and baseline only need run artifacts, so they are built
+    # through the library; test_cli_run_and_compare_regression covers the run CLI.
+    write_json(output_path, run_benchmark(load_suite(suite_path), adapter).to_dict())
 
 
-def test_cli_run_and_compare_regression(tmp_path) -> None:  # type: ignore[no-untyped-def]
-    suite_path = tmp_path / "suite.yaml"
+def test_cli_run_and_compare_regression(tmp_path, shared_artifacts) -> None:  # type: ignore[no-untyped-def]
+    suite_path = shared_artifacts / "suite.yaml"
     baseline_path = tmp_path / "baseline.json"
     candidate_path = tmp_path / "candidate.json"
     compare_path = tmp_path / "compare.json"
-    config_path = tmp_path / "config.yaml"
-    predictions_path = tmp_path / "predictions.json"
-
-    _write_suite(suite_path)
+    config_path = shared_artifacts / "config.yaml"
 
     baseline_rc = main(
         [
@@ -51,26 +79,10 @@ def test_cli_run_and_compare_regression(tmp_path) -> None:  # type: ignore[no-un
         ]
     )
     assert baseline_rc == 0
-    baseline_payload = json.loads(baseline_path.read_text(encoding="utf-8"))
+    baseline_payload = read_json(baseline_path)
     assert "provenance" in baseline_payload
     assert "runtime" in baseline_payload["provenance"]
 
-    predictions_path.write_text(
-        json.dumps(
-            {
-                "affinity_mae": {
-                    "a": {"affinity": -8.0},
-                    "b": {"affinity": -7.0},
-                }
-            }
-        ),
-        encoding="utf-8",
-    )
-    config_path.write_text(
-        yaml.safe_dump({"predictions_path": str(predictions_path)}, sort_keys=False),
-        encoding="utf-8",
-    )
-
     candidate_rc = main(
         [
             "run",
@@ -79,7 +91,7 @@ def test_cli_run_and_compare_regression(tmp_path) -> None:  # type: ignore[no-un
             "--adapter",
             "file",
             "--adapter-config",
-            str(config_path),
+            f"@{config_path}",
             "--output",
             str(candidate_path),
             "--fail-on-errors",
@@ -102,22 +114,6 @@ def test_cli_run_and_compare_regression(tmp_path) -> None:  # type: ignore[no-un
     )
     assert compare_rc == 1
 
-    compare_allow_rc = main(
-        [
-            "compare",
-            "--suite",
-            str(suite_path),
-            "--baseline",
-            str(baseline_path),
-            "--candidate",
-            str(candidate_path),
-            "--output",
-            str(compare_path),
-            "--no-fail-on-regression",
-        ]
-    )
-    assert compare_allow_rc == 0
-
 
 def test_cli_init_creates_project(tmp_path) -> None:  # type: ignore[no-untyped-def]
     out_dir = tmp_path / "starter"
@@ -128,30 +124,13 @@ def test_cli_init_creates_project(tmp_path) -> None:  # type: ignore[no-untyped-
     assert (out_dir / "command_adapter_config.yaml").exists()
 
 
-def test_cli_baseline_registry_flow(tmp_path) -> None:  # type: ignore[no-untyped-def]
-    suite_path = tmp_path / "suite.yaml"
-    baseline_path = tmp_path / "baseline.json"
-    candidate_path = tmp_path / "candidate.json"
+def test_cli_baseline_registry_flow(tmp_path, shared_artifacts) -> None:  # type: ignore[no-untyped-def]
+    suite_path = shared_artifacts / "suite.yaml"
+    baseline_path = shared_artifacts / "baseline.json"
+    candidate_path = shared_artifacts / "candidate.json"
     compare_path = tmp_path / "compare.json"
     registry_path = tmp_path / "registry.json"
     list_path = tmp_path / "list.json"
-    config_path = tmp_path / "config.yaml"
-    predictions_path = tmp_path / "predictions.json"
-
-    _write_suite(suite_path)
-
-    baseline_rc = main(
-        [
-            "run",
-            "--suite",
-            str(suite_path),
-            "--adapter",
-            "golden",
-            "--output",
-            str(baseline_path),
-        ]
-    )
-    assert baseline_rc == 0
 
     promote_baseline_rc = main(
         [
@@ -169,37 +148,6 @@ def test_cli_baseline_registry_flow(tmp_path) -> None:  # type: ignore[no-untype
     )
     assert promote_baseline_rc == 0
 
-    predictions_path.write_text(
-        json.dumps(
-            {
-                "affinity_mae": {
-                    "a": {"affinity": -8.0},
-                    "b": {"affinity": -7.0},
-                }
-            }
-        ),
-        encoding="utf-8",
-    )
-    config_path.write_text(
-        yaml.safe_dump({"predictions_path": str(predictions_path)}, sort_keys=False),
-        encoding="utf-8",
-    )
-
-    candidate_rc = main(
-        [
-            "run",
-            "--suite",
-            str(suite_path),
-            "--adapter",
-            "file",
-            "--adapter-config",
-            str(config_path),
-            "--output",
-            str(candidate_path),
-        ]
-    )
-    assert candidate_rc == 0
-
     compare_rc = main(
         [
             "compare",
@@ -278,7 +226,7 @@ def test_cli_baseline_registry_flow(tmp_path) -> None:  # type: ignore[no-untype
         ]
     )
     assert list_rc == 0
-    listed = json.loads(list_path.read_text(encoding="utf-8"))
+    listed = read_json(list_path)
     assert listed["rows"][0]["baseline_name"] == "stable"
 
 
@@ -287,7 +235,6 @@ def test_cli_compare_fail_on_uncertain(tmp_path) -> None:  # type: ignore[no-unt
     baseline_path = tmp_path / "baseline.json"
     candidate_path = tmp_path / "candidate.json"
     compare_path = tmp_path / "compare.json"
-    config_path = tmp_path / "config.yaml"
     predictions_path = tmp_path / "predictions.json"
 
     payload = {
@@ -306,50 +253,15 @@ def test_cli_compare_fail_on_uncertain(tmp_path) -> None:  # type: ignore[no-unt
             }
         ],
     }
-    suite_path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
-
-    baseline_rc = main(
-        [
-            "run",
-            "--suite",
-            str(suite_path),
-            "--adapter",
-            "golden",
-            "--output",
-            str(baseline_path),
-        ]
-    )
-    assert baseline_rc == 0
+    suite_path.write_text(dump_yaml(payload), encoding="utf-8")
+    _write_run(suite_path, baseline_path, GoldenAdapter())
 
-    predictions_path.write_text(
-        json.dumps(
-            {
-                "mae_task": {
-                    "a": {"value": 0.0},
-                    "b": {"value": 1.0},
-                }
-            }
-        ),
-        encoding="utf-8",
-    )
-    config_path.write_text(
-        yaml.safe_dump({"predictions_path": str(predictions_path)}, sort_keys=False),
-        encoding="utf-8",
+    predictions_path.write_bytes(
+        _json.dumps({"mae_task": {"a": {"value": 0.0}, "b": {"value": 1.0}}})
     )
-    candidate_rc = main(
-        [
-            "run",
-            "--suite",
-            str(suite_path),
-            "--adapter",
-            "file",
-            "--adapter-config",
-            str(config_path),
-            "--output",
-            str(candidate_path),
-        ]
+    _write_run(
+        suite_path, candidate_path, FileAdapter({"predictions_path": str(predictions_path)})
     )
-    assert candidate_rc == 0
 
     compare_default_rc = main(
         [
@@ -391,40 +303,81 @@ def test_cli_compare_fail_on_uncertain(tmp_path) -> None:  # type: ignore[no-unt
     assert compare_fail_uncertain_rc == 1
 
 
-def test_cli_compare_rejects_invalid_candidate_artifact(tmp_path) -> None:  # type: ignore[no-untyped-def]
-    suite_path = tmp_path / "suite.yaml"
-    baseline_path = tmp_path / "baseline.json"
-    candidate_path = tmp_path / "candidate_invalid.json"
-    compare_path = tmp_path / "compare.json"
-
-    _write_suite(suite_path)
-
-    baseline_rc = main(
-        [
-            "run",
-            "--suite",
-            str(suite_path),
-            "--adapter",
-            "golden",
-            "--output",
-            str(baseline_path),
-        ]
-    )
-    assert baseline_rc == 0
-
-    candidate_path.write_text(json.dumps({"run_id": "bad"}), encoding="utf-8")
+@pytest.mark.parametrize(
+    ("invalid_candidate", "extra_args", "expected_rc"),
+    [
+        (None, [], 1),
+        (None, ["--no-fail-on-regression"], 0),
+        ({"run_id": "bad"}, [], 2),
+    ],
+    ids=["regression", "regression-allowed", "invalid-candidate"],
+)
+def test_cli_compare_exit_codes(  # type: ignore[no-untyped-def]
+    tmp_path, shared_artifacts, invalid_candidate, extra_args, expected_rc
+) -> None:
+    candidate_path = shared_artifacts / "candidate.json"
+    if invalid_candidate is not None:
+        candidate_path = tmp_path / "candidate_invalid.json"
+        candidate_path.write_bytes(_json.dumps(invalid_candidate))
 
     compare_rc = main(
         [
             "compare",
             "--suite",
-            str(suite_path),
+            str(shared_artifacts / "suite.yaml"),
             "--baseline",
-            str(baseline_path),
+            str(shared_artifacts / "baseline.json"),
             "--candidate",
             str(candidate_path),
             "--output",
-            str(compare_path),
+            str(tmp_path / "compare.json"),
+            *extra_args,
         ]
     )
-    assert compare_rc == 2
+    assert compare_rc == expected_rc
+
+
+def test_cli_init_refuses_existing_files_without_partial_writes(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    out_dir = tmp_path / "starter"
+    out_dir.mkdir()
+    (out_dir / "baseline.json").write_text("{}", encoding="utf-8")
+
+    rc = main(["init", "--directory", str(out_dir)])
+    assert rc == 2
+    assert sorted(path.name for path in out_dir.iterdir()) == ["baseline.json"]
+
+    rc = main(["init", "--directory", str(out_dir), "--force"])
+    assert rc == 0
+    assert (out_dir / "suite.yaml").exists()
+    assert read_json(out_dir / "baseline.json")["run_id"]
+
+
+def test_load_optional_mapping_prefers_inline_json_and_at_paths(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("predictions_path: preds.json\n", encoding="utf-8")
+
+    assert _load_optional_mapping(f"@{config_path}") == {"predictions_path": "preds.json"}
+    assert _load_optional_mapping('{"timeout_seconds": 5}') == {"timeout_seconds": 5}
+    with pytest.warns(FutureWarning, match="deprecated"):
+        assert _load_optional_mapping(str(config_path)) == {"predictions_path": "preds.json"}
+    with pytest.raises(ValueError, match="valid JSON object"):
+        _load_optional_mapping(str(tmp_path / "missing.yaml"))
+
+
+def test_write_json_keeps_existing_report_when_encoding_fails(tmp_path: Path) -> None:
+    report_path = tmp_path / "nested" / "report.json"
+    write_json(report_path, {"passed": True})
+
+    with pytest.raises(TypeError):
+        write_json(report_path, {"passed": object()})
+    assert read_json(report_path) == {"passed": True}
+
+
+def test_save_registry_keeps_existing_registry_when_encoding_fails(tmp_path: Path) -> None:
+    registry_path = tmp_path / "registry.json"
+    registry = {"version": 1, "baselines": {"suite": {"golden": {"run_id": "r1"}}}}
+    save_registry(registry_path, registry)
+
+    with pytest.raises(TypeError):
+        save_registry(registry_path, {"version": 1, "baselines": {"bad": object()}})
+    assert load_registry(registry_path) == registry
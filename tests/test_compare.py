@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import json
+from dataclasses import asdict
 
+from refua_bench import _json
 from refua_bench.adapters import FileAdapter, GoldenAdapter
-from refua_bench.compare import StatisticalPolicy, compare_runs
+from refua_bench.compare import StatisticalPolicy, compare_runs, prepare_run
 from refua_bench.runner import run_benchmark
 from refua_bench.schema import suite_from_mapping
 
 
-def test_compare_passes_identical_runs(suite) -> None:  # type: ignore[no-untyped-def]
-    baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
+def test_compare_passes_identical_runs(suite, golden_run) -> None:  # type: ignore[no-untyped-def]
+    baseline = golden_run
     candidate = run_benchmark(suite, GoldenAdapter()).to_dict()
 
     report = compare_runs(suite, baseline, candidate).to_dict()
@@ -17,7 +18,7 @@ def test_compare_passes_identical_runs(suite) -> None:  # type: ignore[no-untype
     assert report["summary"]["regressions"] == 0
 
 
-def test_compare_detects_regression(suite, tmp_path) -> None:  # type: ignore[no-untyped-def]
+def test_compare_detects_regression(suite, golden_run, tmp_path) -> None:  # type: ignore[no-untyped-def]
     predictions = {
         "affinity_mae": {
             "a": {"affinity": -8.2},
@@ -29,14 +30,17 @@ def test_compare_detects_regression(suite, tmp_path) -> None:  # type: ignore[no
         },
     }
     pred_path = tmp_path / "candidate.json"
-    pred_path.write_text(json.dumps(predictions), encoding="utf-8")
+    pred_path.write_bytes(_json.dumps(predictions))
 
-    baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
+    baseline = golden_run
     candidate = run_benchmark(
         suite, FileAdapter({"predictions_path": str(pred_path)})
     ).to_dict()
 
-    report = compare_runs(suite, baseline, candidate).to_dict()
+    result = compare_runs(suite, baseline, candidate)
+    assert result.failed(fail_on_uncertain=False) is True
+
+    report = result.to_dict()
     assert report["summary"]["passed"] is False
     assert report["summary"]["regressions"] >= 1
 
@@ -96,7 +100,7 @@ def test_compare_detects_enrichment_factor_regression(tmp_path) -> None:  # type
         }
     }
     pred_path = tmp_path / "candidate.json"
-    pred_path.write_text(json.dumps(predictions), encoding="utf-8")
+    pred_path.write_bytes(_json.dumps(predictions))
 
     baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
     candidate = run_benchmark(
@@ -165,7 +169,7 @@ def test_compare_detects_bedroc_regression(tmp_path) -> None:  # type: ignore[no
         }
     }
     pred_path = tmp_path / "candidate.json"
-    pred_path.write_text(json.dumps(predictions), encoding="utf-8")
+    pred_path.write_bytes(_json.dumps(predictions))
 
     baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
     candidate = run_benchmark(
@@ -209,7 +213,7 @@ def test_compare_min_effect_size_avoids_noise(tmp_path) -> None:  # type: ignore
         }
     }
     pred_path = tmp_path / "candidate.json"
-    pred_path.write_text(json.dumps(predictions), encoding="utf-8")
+    pred_path.write_bytes(_json.dumps(predictions))
 
     baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
     candidate = run_benchmark(
@@ -227,12 +231,9 @@ def test_compare_min_effect_size_avoids_noise(tmp_path) -> None:  # type: ignore
 
 
 def test_compare_bootstrap_confirms_regression(tmp_path) -> None:  # type: ignore[no-untyped-def]
-    cases = []
-    predictions: dict[str, dict[str, dict[str, float]]] = {"mae_task": {}}
-    for idx in range(20):
-        case_id = f"c{idx}"
-        cases.append({"id": case_id, "input": {}, "expected": {"value": 0.0}})
-        predictions["mae_task"][case_id] = {"value": 1.0}
+    case_ids = [f"c{idx}" for idx in range(20)]
+    cases = [{"id": case_id, "input": {}, "expected": {"value": 0.0}} for case_id in case_ids]
+    predictions = {"mae_task": {case_id: {"value": 1.0} for case_id in case_ids}}
 
     suite = suite_from_mapping(
         {
@@ -251,7 +252,7 @@ def test_compare_bootstrap_confirms_regression(tmp_path) -> None:  # type: ignor
     )
 
     pred_path = tmp_path / "candidate.json"
-    pred_path.write_text(json.dumps(predictions), encoding="utf-8")
+    pred_path.write_bytes(_json.dumps(predictions))
 
     baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
     candidate = run_benchmark(
@@ -302,14 +303,14 @@ def test_compare_bootstrap_can_be_uncertain(tmp_path) -> None:  # type: ignore[n
         }
     }
     pred_path = tmp_path / "candidate.json"
-    pred_path.write_text(json.dumps(predictions), encoding="utf-8")
+    pred_path.write_bytes(_json.dumps(predictions))
 
     baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
     candidate = run_benchmark(
         suite, FileAdapter({"predictions_path": str(pred_path)})
     ).to_dict()
 
-    report = compare_runs(
+    result = compare_runs(
         suite,
         baseline,
         candidate,
@@ -318,7 +319,219 @@ def test_compare_bootstrap_can_be_uncertain(tmp_path) -> None:  # type: ignore[n
             confidence_level=0.95,
             bootstrap_seed=17,
         ),
-    ).to_dict()
+    )
+    assert result.failed(fail_on_uncertain=False) is False
+    assert result.failed(fail_on_uncertain=True) is True
 
+    report = result.to_dict()
     assert report["summary"]["uncertain"] == 1
     assert report["task_comparisons"][0]["status"] == "uncertain"
+
+
+def test_compare_fast_path_matches_bootstrap_for_identical_cases(suite, golden_run) -> None:  # type: ignore[no-untyped-def]
+    baseline = golden_run
+    candidate = run_benchmark(suite, GoldenAdapter()).to_dict()
+    policy = StatisticalPolicy(bootstrap_resamples=200, bootstrap_seed=3)
+
+    fast = compare_runs(suite, baseline, candidate, policy=policy).to_dict()
+    full = compare_runs(suite, baseline, candidate, policy=policy, fast_path=False).to_dict()
+
+    fast_tasks = fast.pop("task_comparisons")
+    full_tasks = full.pop("task_comparisons")
+    assert fast == full
+    for fast_task, full_task in zip(fast_tasks, full_tasks, strict=True):
+        assert fast_task["resamples_used"] == 0
+        assert full_task["resamples_used"] == 200
+        fast_task.pop("resamples_used")
+        full_task.pop("resamples_used")
+        assert fast_task == full_task
+    assert fast_tasks[0]["ci_high"] == 0.0
+
+
+def test_compare_fast_path_resamples_metrics_that_can_fail(suite_payload) -> None:  # type: ignore[no-untyped-def]
+    suite_payload["tasks"][1]["metric"] = "bedroc"
+    suite = suite_from_mapping(suite_payload)
+    baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
+    candidate = run_benchmark(suite, GoldenAdapter()).to_dict()
+    policy = StatisticalPolicy(bootstrap_resamples=200, bootstrap_seed=3)
+
+    fast = compare_runs(suite, baseline, candidate, policy=policy).to_dict()
+    full = compare_runs(suite, baseline, candidate, policy=policy, fast_path=False).to_dict()
+
+    assert fast["task_comparisons"][0]["resamples_used"] == 0
+    bedroc = fast["task_comparisons"][1]
+    assert bedroc == full["task_comparisons"][1]
+    assert bedroc["resamples_used"] != 0
+
+
+def test_compare_bootstrap_workers_do_not_change_results(suite, golden_run, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    predictions = {
+        "affinity_mae": {"a": {"affinity": -8.2}, "b": {"affinity": -7.9}},
+        "tox_acc": {"c1": {"toxic": 1}, "c2": {"toxic": 1}},
+    }
+    pred_path = tmp_path / "candidate.json"
+    pred_path.write_bytes(_json.dumps(predictions))
+
+    baseline = golden_run
+    candidate = run_benchmark(
+        suite, FileAdapter({"predictions_path": str(pred_path)})
+    ).to_dict()
+    policy = StatisticalPolicy(bootstrap_resamples=100, bootstrap_seed=11)
+
+    serial = compare_runs(suite, baseline, candidate, policy=policy).to_dict()
+    parallel = compare_runs(suite, baseline, candidate, policy=policy, workers=2).to_dict()
+    assert parallel == serial
+
+
+def test_comparison_report_to_dict_matches_asdict(suite, golden_run) -> None:  # type: ignore[no-untyped-def]
+    baseline = golden_run
+    report = compare_runs(suite, baseline, baseline)
+
+    assert report.to_dict() == asdict(report)
+
+
+def test_compare_accepts_prepared_runs(suite, golden_run, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    predictions = {
+        "affinity_mae": {"a": {"affinity": -8.2}, "b": {"affinity": -7.9}},
+        "tox_acc": {"c1": {"toxic": 1}, "c2": {"toxic": 1}},
+    }
+    pred_path = tmp_path / "candidate.json"
+    pred_path.write_bytes(_json.dumps(predictions))
+
+    baseline = golden_run
+    candidate = run_benchmark(
+        suite, FileAdapter({"predictions_path": str(pred_path)})
+    ).to_dict()
+    prepared_baseline = prepare_run(baseline)
+    prepared_candidate = prepare_run(candidate)
+
+    for resamples in (0, 50):
+        policy = StatisticalPolicy(bootstrap_resamples=resamples, bootstrap_seed=2)
+        assert compare_runs(
+            suite, prepared_baseline, prepared_candidate, policy=policy
+        ).to_dict() == compare_runs(suite, baseline, candidate, policy=policy).to_dict()
+
+
+def test_compare_sequential_stopping_keeps_clear_verdicts(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    cases = [
+        {"id": f"c{index}", "input": {}, "expected": {"value": 0.0}} for index in range(20)
+    ]
+    suite = suite_from_mapping(
+        {
+            "name": "clear-regression",
+            "version": "1.0.0",
+            "tasks": [
+                {
+                    "id": "mae_task",
+                    "metric": "mae",
+                    "prediction_key": "value",
+                    "regression_tolerance": 0.1,
+                    "cases": cases,
+                }
+            ],
+        }
+    )
+    predictions = {"mae_task": {case["id"]: {"value": 1.0} for case in cases}}
+    pred_path = tmp_path / "candidate.json"
+    pred_path.write_bytes(_json.dumps(predictions))
+
+    baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
+    candidate = run_benchmark(
+        suite, FileAdapter({"predictions_path": str(pred_path)})
+    ).to_dict()
+
+    def _compare(sequential_stopping: bool) -> dict[str, object]:
+        policy = StatisticalPolicy(
+            bootstrap_resamples=4000,
+            bootstrap_seed=5,
+            sequential_stopping=sequential_stopping,
+        )
+        return compare_runs(suite, baseline, candidate, policy=policy).to_dict()
+
+    full = _compare(False)["task_comparisons"][0]
+    early = _compare(True)["task_comparisons"][0]
+    assert full["resamples_used"] == 4000
+    assert early["resamples_used"] < 4000
+    assert early["status"] == full["status"] == "regression"
+
+
+def test_compare_screen_skips_bootstrap_for_clear_tasks(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    cases = [
+        {"id": f"c{index}", "input": {}, "expected": {"value": 0.0}} for index in range(20)
+    ]
+    suite = suite_from_mapping(
+        {
+            "name": "screened",
+            "version": "1.0.0",
+            "tasks": [
+                {
+                    "id": "mae_task",
+                    "metric": "mae",
+                    "prediction_key": "value",
+                    "regression_tolerance": 0.1,
+                    "cases": cases,
+                }
+            ],
+        }
+    )
+    predictions = {
+        "mae_task": {case["id"]: {"value": 1.0 + index / 100} for index, case in enumerate(cases)}
+    }
+    pred_path = tmp_path / "candidate.json"
+    pred_path.write_bytes(_json.dumps(predictions))
+
+    baseline = run_benchmark(suite, GoldenAdapter()).to_dict()
+    candidate = run_benchmark(
+        suite, FileAdapter({"predictions_path": str(pred_path)})
+    ).to_dict()
+
+    def _compare(screen_sigmas: float) -> dict[str, object]:
+        policy = StatisticalPolicy(
+            bootstrap_resamples=500, bootstrap_seed=5, screen_sigmas=screen_sigmas
+        )
+        return compare_runs(suite, baseline, candidate, policy=policy).to_dict()
+
+    full = _compare(0.0)["task_comparisons"][0]
+    screened = _compare(4.0)["task_comparisons"][0]
+    assert full["resamples_used"] == 500
+    assert screened["resamples_used"] == 0
+    assert screened["ci_low"] is None
+    assert screened["status"] == full["status"] == "regression"
+
+    reverse = compare_runs(
+        suite,
+        candidate,
+        baseline,
+        policy=StatisticalPolicy(bootstrap_resamples=500, screen_sigmas=4.0),
+    ).task_comparisons[0]
+    assert reverse.status == "pass"
+    assert reverse.resamples_used == 0
+
+
+def test_compare_shared_resamples_reuse_the_first_task_stream(suite, golden_run, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    predictions = {
+        "affinity_mae": {"a": {"affinity": -8.2}, "b": {"affinity": -7.9}},
+        "tox_acc": {"c1": {"toxic": 1}, "c2": {"toxic": 1}},
+    }
+    pred_path = tmp_path / "candidate.json"
+    pred_path.write_bytes(_json.dumps(predictions))
+
+    baseline = golden_run
+    candidate = run_benchmark(
+        suite, FileAdapter({"predictions_path": str(pred_path)})
+    ).to_dict()
+    separate = compare_runs(
+        suite,
+        baseline,
+        candidate,
+        policy=StatisticalPolicy(bootstrap_resamples=100, bootstrap_seed=11),
+    )
+    shared_policy = StatisticalPolicy(
+        bootstrap_resamples=100, bootstrap_seed=11, share_resamples=True
+    )
+    shared = compare_runs(suite, baseline, candidate, policy=shared_policy)
+    parallel = compare_runs(suite, baseline, candidate, policy=shared_policy, workers=2)
+
+    assert shared.task_comparisons[0] == separate.task_comparisons[0]
+    assert shared.to_dict() == parallel.to_dict()
+    assert shared.policy["share_resamples"] is True
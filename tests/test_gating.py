@@ -3,13 +3,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-import yaml
-
 from refua_bench.adapters import GoldenAdapter
 from refua_bench.gating import gate_suite
 from refua_bench.reporting import write_json
 from refua_bench.runner import run_benchmark
-from refua_bench.schema import load_suite
+from refua_bench.schema import dump_yaml, load_suite
 
 
 def _write_suite(path: Path) -> None:
@@ -29,7 +27,7 @@ def _write_suite(path: Path) -> None:
             }
         ],
     }
-    path.write_text(yaml.safe_dump(payload, sort_keys=False), encoding="utf-8")
+    path.write_text(dump_yaml(payload), encoding="utf-8")
 
 
 def test_gate_suite_runs_candidate_and_compare(tmp_path: Path) -> None:
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 import pytest
 
-from refua_bench.metrics import compute_metric, metric_direction
+from refua_bench.metrics import (
+    compute_metric,
+    metric_direction,
+    paired_resample_scorer,
+    resample_scorer,
+)
 
 
 def test_metric_direction() -> None:
@@ -103,3 +108,43 @@ def test_bedroc_requires_positive_labels() -> None:
             positive_label=1,
             bedroc_alpha=20.0,
         )
+
+
+@pytest.mark.parametrize(
+    ("metric", "expected", "predicted"),
+    [
+        ("mae", [1.0, 3.0, -2.5, 0.1], [2.0, 1.0, -2.0, 0.3]),
+        ("rmse", [1.0, 3.0, -2.5, 0.1], [2.0, 1.0, -2.0, 0.3]),
+        ("accuracy", [1, 0, 1, 1], [1, 1, 1, 0]),
+        ("f1", [1, 0, 1, 0], [1, 1, 0, 0]),
+    ],
+)
+def test_resample_scorer_matches_compute_metric(
+    metric: str, expected: list[float], predicted: list[float]
+) -> None:
+    scorer = resample_scorer(metric, expected, predicted)
+    assert scorer is not None
+    for indices in ([0, 1, 2, 3], [3, 3, 0, 1], [2, 2, 2, 2]):
+        assert scorer(indices) == compute_metric(
+            metric,
+            [expected[index] for index in indices],
+            [predicted[index] for index in indices],
+        )
+
+
+def test_resample_scorer_skips_rank_metrics_and_bad_values() -> None:
+    assert resample_scorer("bedroc", [1, 0], [0.9, 0.1]) is None
+    assert resample_scorer("mae", [1.0, 2.0], ["x", 1.0]) is None
+
+
+@pytest.mark.parametrize("metric", ["accuracy", "f1", "mae"])
+def test_paired_resample_scorer_matches_single_run_scorers(metric: str) -> None:
+    baseline = ([1, 0, 1, 0, 1], [1, 1, 0, 0, 1])
+    candidate = ([1, 0, 1, 0, 1], [0, 1, 1, 0, 0])
+    scorer = paired_resample_scorer(metric, baseline, candidate)
+    assert scorer is not None
+    for indices in ([0, 1, 2, 3, 4], [4, 4, 1, 0, 2], [3, 3, 3, 3, 3]):
+        assert scorer(indices) == (
+            compute_metric(metric, *[[values[i] for i in indices] for values in baseline]),
+            compute_metric(metric, *[[values[i] for i in indices] for values in candidate]),
+        )
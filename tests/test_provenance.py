@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from refua_bench.provenance import collect_provenance
+
+
+def test_fast_provenance_matches_full_capture(tmp_path: Path) -> None:
+    kwargs = {"adapter_name": "golden", "adapter_spec": "golden", "adapter_config": None}
+    full = collect_provenance(cwd=tmp_path, fast=False, **kwargs)
+    fast = collect_provenance(cwd=tmp_path, **kwargs)
+
+    assert fast["runtime"] == full["runtime"]
+    assert fast["git"] == full["git"]
+    # Cached sections are handed out as copies.
+    fast["runtime"]["hostname"] = "changed"
+    again = collect_provenance(cwd=tmp_path, **kwargs)
+    assert again["runtime"] == full["runtime"]
+
+
+def test_fast_provenance_sees_tracked_file_edits(tmp_path: Path) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    tracked = tmp_path / "tracked.txt"
+    tracked.write_text("one\n", encoding="utf-8")
+    # Backdated so git does not treat the entry as racily clean and keep
+    # rewriting the index on every status query.
+    os.utime(tracked, (0, 0))
+    git("add", "tracked.txt")
+    git("-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init")
+
+    kwargs = {"adapter_name": "golden", "adapter_spec": "golden", "adapter_config": None}
+    assert collect_provenance(cwd=tmp_path, **kwargs)["git"]["dirty"] is False
+
+    # Editing a tracked file touches neither HEAD nor the index.
+    tracked.write_text("two\n", encoding="utf-8")
+    assert collect_provenance(cwd=tmp_path, **kwargs)["git"]["dirty"] is True
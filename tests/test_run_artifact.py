@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import copy
+import os
+from pathlib import Path
+from typing import Any
+
 import pytest
 
-from refua_bench.adapters import GoldenAdapter
-from refua_bench.run_artifact import validate_run_artifact
-from refua_bench.runner import run_benchmark
+from refua_bench.reporting import write_json
+from refua_bench.run_artifact import load_and_validate_run_artifact, validate_run_artifact
 from refua_bench.schema import BenchmarkSuite
 
 
-def test_validate_run_artifact_accepts_runner_output(suite: BenchmarkSuite) -> None:
-    run_payload = run_benchmark(suite, GoldenAdapter()).to_dict()
+def test_validate_run_artifact_accepts_runner_output(
+    suite: BenchmarkSuite, golden_run: dict[str, Any]
+) -> None:
     validated = validate_run_artifact(
-        run_payload,
+        golden_run,
         source="candidate",
         suite=suite,
     )
@@ -19,26 +24,68 @@ def test_validate_run_artifact_accepts_runner_output(suite: BenchmarkSuite) -> N
 
 
 def test_validate_run_artifact_rejects_missing_top_level_key(
-    suite: BenchmarkSuite,
+    suite: BenchmarkSuite, golden_run: dict[str, Any]
 ) -> None:
-    run_payload = run_benchmark(suite, GoldenAdapter()).to_dict()
-    run_payload.pop("summary")
+    run_payload = {key: value for key, value in golden_run.items() if key != "summary"}
 
     with pytest.raises(ValueError, match="invalid keys"):
         validate_run_artifact(run_payload, source="candidate", suite=suite)
 
 
-def test_validate_run_artifact_rejects_summary_mismatch(suite: BenchmarkSuite) -> None:
-    run_payload = run_benchmark(suite, GoldenAdapter()).to_dict()
-    run_payload["summary"]["cases_total"] = 999
+def test_validate_run_artifact_rejects_summary_mismatch(
+    suite: BenchmarkSuite, golden_run: dict[str, Any]
+) -> None:
+    run_payload = {**golden_run, "summary": {**golden_run["summary"], "cases_total": 999}}
 
     with pytest.raises(ValueError, match="cases_total"):
         validate_run_artifact(run_payload, source="candidate", suite=suite)
 
 
-def test_validate_run_artifact_rejects_suite_mismatch(suite: BenchmarkSuite) -> None:
-    run_payload = run_benchmark(suite, GoldenAdapter()).to_dict()
-    run_payload["suite_name"] = "other-suite"
+def test_validate_run_artifact_rejects_suite_mismatch(
+    suite: BenchmarkSuite, golden_run: dict[str, Any]
+) -> None:
+    run_payload = {**golden_run, "suite_name": "other-suite"}
 
     with pytest.raises(ValueError, match="suite_name"):
         validate_run_artifact(run_payload, source="candidate", suite=suite)
+
+
+def test_validate_run_artifact_reports_exact_case_errors(
+    suite: BenchmarkSuite, golden_run: dict[str, Any]
+) -> None:
+    run_payload = copy.deepcopy(golden_run)
+    case_results = run_payload["task_results"][0]["case_results"]
+    case_results[1]["case_id"] = case_results[0]["case_id"] + " "
+
+    with pytest.raises(ValueError, match=r"Duplicate case_id in candidate.task_results\[0\]"):
+        validate_run_artifact(run_payload, source="candidate", suite=suite)
+
+    case_results[1]["case_id"] = "b"
+    case_results[1]["duration_ms"] = float("nan")
+    with pytest.raises(
+        ValueError, match=r"task_results\[0\]\.case_results\[1\]\.duration_ms must be a finite"
+    ):
+        validate_run_artifact(run_payload, source="candidate", suite=suite)
+
+
+def test_load_run_artifact_cache_reuses_until_file_changes(
+    suite: BenchmarkSuite,
+    golden_run: dict[str, Any],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("REFUA_BENCH_CACHE", "1")
+    path = tmp_path / "run.json"
+    write_json(path, golden_run)
+
+    first = load_and_validate_run_artifact(path, source="baseline", suite=suite)
+    again = load_and_validate_run_artifact(path, source="baseline", suite=suite)
+    assert again["task_results"][0] is first["task_results"][0]
+
+    write_json(path, {**golden_run, "run_id": "rewritten"})
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+    assert load_and_validate_run_artifact(path, source="baseline")["run_id"] == "rewritten"
+
+    monkeypatch.delenv("REFUA_BENCH_CACHE")
+    uncached = load_and_validate_run_artifact(path, source="baseline")
+    assert uncached["task_results"][0] is not first["task_results"][0]
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 
 import pytest
 
-from refua_bench.adapters import FileAdapter, GoldenAdapter
-from refua_bench.runner import run_benchmark
+from refua_bench import _json
+from refua_bench.adapters import CommandAdapter, FileAdapter, GoldenAdapter
+from refua_bench.runner import run_benchmark, synthesize_golden_artifact
 from refua_bench.schema import BenchmarkSuite, suite_from_mapping
 
 
@@ -19,6 +21,49 @@ def test_runner_golden_has_no_failures(suite) -> None:  # type: ignore[no-untype
     assert first_task["score"] == pytest.approx(0.0)
 
 
+def test_synthesized_golden_artifact_matches_runner(suite_payload) -> None:  # type: ignore[no-untyped-def]
+    suite_payload["tasks"].append(
+        {
+            "id": "renamed",
+            "metric": "mae",
+            "prediction_key": "value",
+            "expected_key": "target_value",
+            "cases": [{"id": "x", "input": {}, "expected": {"target_value": 1.0}}],
+        }
+    )
+    suite = suite_from_mapping(suite_payload)
+
+    def _normalized(payload: dict[str, object]) -> dict[str, object]:
+        payload = json.loads(json.dumps(payload))
+        for key in ("run_id", "started_at", "finished_at"):
+            payload.pop(key)
+        for task_payload in payload["task_results"]:
+            for case_payload in task_payload["case_results"]:
+                case_payload.pop("duration_ms")
+        return payload
+
+    expected = run_benchmark(suite, GoldenAdapter()).to_dict()
+    synthesized = synthesize_golden_artifact(suite)
+    assert list(synthesized) == list(expected)
+    assert _normalized(synthesized) == _normalized(expected)
+
+
+def test_run_to_dict_matches_asdict(suite) -> None:  # type: ignore[no-untyped-def]
+    run = run_benchmark(
+        suite,
+        GoldenAdapter(),
+        provenance={"model": {"name": "demo", "tags": ["a"]}},
+    )
+    run.task_results[0].case_results[0].predicted = {"nested": [1, 2]}
+    payload = run.to_dict()
+    assert payload == asdict(run)
+
+    payload["provenance"]["model"]["tags"].append("b")
+    payload["task_results"][0]["case_results"][0]["predicted"]["nested"].append(3)
+    assert run.provenance["model"]["tags"] == ["a"]
+    assert run.task_results[0].case_results[0].predicted == {"nested": [1, 2]}
+
+
 def test_runner_accepts_provenance_payload(suite) -> None:  # type: ignore[no-untyped-def]
     run = run_benchmark(
         suite,
@@ -41,7 +86,7 @@ def test_runner_with_file_adapter(suite, tmp_path) -> None:  # type: ignore[no-u
         },
     }
     pred_path = tmp_path / "predictions.json"
-    pred_path.write_text(json.dumps(predictions), encoding="utf-8")
+    pred_path.write_bytes(_json.dumps(predictions))
 
     adapter = FileAdapter({"predictions_path": str(pred_path)})
     run = run_benchmark(suite, adapter).to_dict()
@@ -83,7 +128,7 @@ def test_runner_enrichment_factor_uses_task_fraction(tmp_path) -> None:  # type:
         }
     }
     pred_path = tmp_path / "predictions.json"
-    pred_path.write_text(json.dumps(predictions), encoding="utf-8")
+    pred_path.write_bytes(_json.dumps(predictions))
 
     adapter = FileAdapter({"predictions_path": str(pred_path)})
     run = run_benchmark(suite, adapter).to_dict()
@@ -126,7 +171,7 @@ def test_runner_bedroc_uses_task_alpha(tmp_path) -> None:  # type: ignore[no-unt
         }
     }
     pred_path = tmp_path / "bedroc_predictions.json"
-    pred_path.write_text(json.dumps(predictions), encoding="utf-8")
+    pred_path.write_bytes(_json.dumps(predictions))
     adapter = FileAdapter({"predictions_path": str(pred_path)})
 
     low_alpha_run = run_benchmark(build_suite(5.0), adapter).to_dict()
@@ -135,3 +180,81 @@ def test_runner_bedroc_uses_task_alpha(tmp_path) -> None:  # type: ignore[no-unt
     low_score = float(low_alpha_run["task_results"][0]["score"])
     high_score = float(high_alpha_run["task_results"][0]["score"])
     assert high_score > low_score
+
+
+class _BatchOnlyAdapter:
+    name = "batch-only"
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def predict(self, task, case):  # type: ignore[no-untyped-def]
+        raise AssertionError("predict should not be called for batching adapters")
+
+    def predict_many(self, task, cases):  # type: ignore[no-untyped-def]
+        self.batches.append([case.case_id for case in cases])
+        outputs: list[object] = [dict(case.expected) for case in cases]
+        outputs[-1] = RuntimeError("model unavailable")
+        return outputs
+
+
+def test_runner_sends_each_task_as_one_batch(suite) -> None:  # type: ignore[no-untyped-def]
+    adapter = _BatchOnlyAdapter()
+    payload = run_benchmark(suite, adapter).to_dict()
+
+    assert adapter.batches == [["a", "b"], ["c1", "c2"]]
+    first_task = payload["task_results"][0]
+    assert first_task["case_failures"] == 1
+    assert first_task["case_results"][0]["error"] is None
+    assert first_task["case_results"][1]["error"] == "model unavailable"
+    durations = {case["duration_ms"] for case in first_task["case_results"]}
+    assert len(durations) == 1
+
+
+class _LoopingAdapter:
+    name = "looping"
+    batching = False
+
+    def predict(self, task, case):  # type: ignore[no-untyped-def]
+        return case.expected
+
+    def predict_many(self, task, cases):  # type: ignore[no-untyped-def]
+        raise AssertionError("predict_many should not be called when batching is False")
+
+
+def test_runner_keeps_per_case_calls_for_non_batching_adapters(suite) -> None:  # type: ignore[no-untyped-def]
+    payload = run_benchmark(suite, _LoopingAdapter()).to_dict()
+    assert payload["summary"]["case_failures"] == 0
+    assert CommandAdapter({"command": ["true"]}).batching is False
+    assert CommandAdapter({"command": ["true"], "batch": True}).batching is True
+
+
+def test_runner_parallelism_requires_thread_safe_adapter(suite) -> None:  # type: ignore[no-untyped-def]
+    import threading
+
+    class _RecordingAdapter:
+        name = "recording"
+
+        def __init__(self, thread_safe: bool) -> None:
+            self.thread_safe = thread_safe
+            self.threads: set[int] = set()
+            self.barrier = threading.Barrier(2, timeout=5)
+
+        def predict(self, task, case):  # type: ignore[no-untyped-def]
+            self.threads.add(threading.get_ident())
+            if self.thread_safe and case is task.cases[0]:
+                # Both tasks must be in flight at once to get past the barrier.
+                self.barrier.wait()
+            return case.expected
+
+    serial = _RecordingAdapter(thread_safe=False)
+    serial_payload = run_benchmark(suite, serial, parallelism=2).to_dict()
+    assert serial.threads == {threading.get_ident()}
+
+    parallel = _RecordingAdapter(thread_safe=True)
+    parallel_payload = run_benchmark(suite, parallel, parallelism=2).to_dict()
+    assert len(parallel.threads) == 2
+    assert [task["task_id"] for task in parallel_payload["task_results"]] == [
+        task["task_id"] for task in serial_payload["task_results"]
+    ]
+    assert parallel_payload["summary"] == serial_payload["summary"]
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import os
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
 
-from refua_bench.schema import load_data_file, suite_from_mapping
+from refua_bench.schema import (
+    dump_json,
+    dump_yaml,
+    load_data_file,
+    load_suite,
+    suite_from_mapping,
+)
 
 
 def test_suite_defaults(suite_payload: dict[str, object]) -> None:
@@ -60,3 +68,39 @@ def test_invalid_bedroc_alpha_raises(suite_payload: dict[str, object]) -> None:
 
     with pytest.raises(ValueError, match="bedroc_alpha"):
         suite_from_mapping(payload)
+
+
+def test_load_suite_cache_reuses_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, suite_payload: dict[str, object]
+) -> None:
+    monkeypatch.setenv("REFUA_BENCH_CACHE", "1")
+    path = tmp_path / "suite.yaml"
+    path.write_text(dump_yaml(suite_payload), encoding="utf-8")
+
+    first = load_suite(path)
+    assert load_suite(path) is first
+
+    suite_payload["version"] = "2.0.0"
+    path.write_text(dump_yaml(suite_payload), encoding="utf-8")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+    assert load_suite(path).version == "2.0.0"
+
+    monkeypatch.delenv("REFUA_BENCH_CACHE")
+    assert load_suite(path) is not load_suite(path)
+
+
+def test_case_id_index_is_built_once(suite_payload: dict[str, object]) -> None:
+    suite = suite_from_mapping(suite_payload)
+    index = suite.case_id_index()
+    assert index == {"affinity_mae": frozenset({"a", "b"}), "tox_acc": frozenset({"c1", "c2"})}
+    assert suite.case_id_index() is index
+    assert suite == suite_from_mapping(suite_payload)
+
+
+def test_dump_json_keeps_existing_file_when_encoding_fails(tmp_path: Path) -> None:
+    out_path = tmp_path / "suite.json"
+    dump_json(out_path, {"name": "demo"})
+
+    with pytest.raises(TypeError):
+        dump_json(out_path, {"name": object()})
+    assert load_data_file(out_path) == {"name": "demo"}